@@ -6,7 +6,7 @@ from typing import List, Dict, Any, Optional
 import openai
 import boto3
 import time
-import hashlib
+from blake3 import blake3
 
 logger = logging.getLogger(__name__)
 
@@ -442,7 +442,7 @@ class RAGSystem:
     def _generate_cache_key(self, question: str, site_name: Optional[str] = None) -> str:
         """Generate cache key for query caching"""
         key_text = f"{question.lower().strip()}:{site_name or 'all'}"
-        return hashlib.md5(key_text.encode()).hexdigest()
+        return blake3(key_text.encode()).hexdigest(length=16)
     
     def _should_use_cached_response(self, question: str, cached_data: Dict[str, Any]) -> bool:
         """Determine if cached response should be used"""
@@ -499,7 +499,7 @@ class RAGSystem:
     
     def _generate_content_hash(self, text: str) -> str:
         """Generate hash for content deduplication"""
-        return hashlib.md5(text.lower().strip().encode()).hexdigest()
+        return blake3(text.lower().strip().encode()).hexdigest(length=16)
     
     def _calculate_result_relevance(self, result: Dict[str, Any], question: str) -> float:
         """Calculate relevance score for a search result"""
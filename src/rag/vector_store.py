@@ -1,10 +1,14 @@
 import json
 import os
 import hashlib
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Set, Optional
+from typing import List, Dict, Any, Set, Optional, Iterator, Callable
 import chromadb
 from chromadb.config import Settings
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from chromadb.errors import InvalidCollectionException
 from sentence_transformers import SentenceTransformer
 from loguru import logger
 from urllib.parse import urlparse
@@ -13,6 +17,37 @@ from urllib.parse import urlparse
 os.environ["SENTENCE_TRANSFORMERS_HOME"] = "/tmp/sentence_transformers"
 os.environ["HF_HUB_DISABLE_TELEMETRY"] = "1"
 
+# Number of metadata rows fetched per request when computing site stats
+STATS_PAGE_SIZE = 10000
+
+# Number of chunks sent to Chroma per add call
+ADD_BATCH_SIZE = 500
+
+
+@lru_cache(maxsize=8192)
+def _site_from_url(url: str) -> str:
+    """Extract site name from URL, memoized since documents share few sites"""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        # Remove www. prefix if present
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+    except:
+        # Fallback: use URL as site name
+        return url.replace("://", "_").replace("/", "_").replace(".", "_")
+
+
+class SentenceTransformerEmbedding(EmbeddingFunction):
+    """Chroma embedding function backed by an already loaded SentenceTransformer"""
+    
+    def __init__(self, model: SentenceTransformer):
+        self._model = model
+    
+    def __call__(self, input: Documents) -> Embeddings:
+        return self._model.encode(list(input), convert_to_numpy=True).tolist()
+
 
 class VectorStore:
     """Vector store for storing and searching scraped documents with site-wise organization"""
@@ -33,9 +68,15 @@ class VectorStore:
         # Initialize embedding model
         self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         
+        # Embed through the loaded model so Chroma doesn't load its own copy
+        self._embedding_function = SentenceTransformerEmbedding(self.embedding_model)
+        
         # Track content hashes to prevent duplicates per site
         self._content_hashes: Dict[str, Set[str]] = {}
         
+        # Cache collection handles per site to avoid repeated lookups
+        self._collections: Dict[str, Any] = {}
+        
         # Track available sites
         self._available_sites = self._discover_sites()
         
@@ -55,36 +96,69 @@ class VectorStore:
             logger.warning(f"Error discovering sites: {e}")
         return sites
     
+    def _get_collection(self, site_name: str):
+        """Get cached collection handle for a known site"""
+        collection = self._collections.get(site_name)
+        if collection is None:
+            collection_name = self._available_sites.get(site_name, f"site_{site_name}")
+            collection = self.client.get_collection(collection_name, embedding_function=self._embedding_function)
+            self._available_sites[site_name] = collection_name
+            self._collections[site_name] = collection
+        return collection
+    
     def _get_site_name(self, url: str) -> str:
         """Extract site name from URL"""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www. prefix if present
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except:
-            # Fallback: use URL as site name
-            return url.replace("://", "_").replace("/", "_").replace(".", "_")
+        return _site_from_url(url)
     
     def _get_or_create_site_collection(self, site_name: str):
         """Get or create collection for a specific site"""
         collection_name = f"site_{site_name}"
         
-        if collection_name not in self._available_sites:
+        if site_name not in self._available_sites:
             try:
-                collection = self.client.get_collection(collection_name)
+                collection = self.client.get_collection(collection_name, embedding_function=self._embedding_function)
                 self._available_sites[site_name] = collection_name
             except:
-                collection = self.client.create_collection(collection_name)
+                collection = self.client.create_collection(collection_name, embedding_function=self._embedding_function)
                 self._available_sites[site_name] = collection_name
-                self._content_hashes[site_name] = set()
+                # Cleared in place, since a running _iter_chunks may hold this set
+                self._content_hashes.setdefault(site_name, set()).clear()
+            self._collections[site_name] = collection
         else:
-            collection = self.client.get_collection(collection_name)
+            collection = self._get_collection(site_name)
         
         return collection
     
+    def _forget_collection(self, site_name: str):
+        """Drop the cached handle for a collection another VectorStore (API or worker) deleted"""
+        logger.warning(f"Collection for site {site_name} no longer exists, refetching")
+        self._collections.pop(site_name, None)
+        self._available_sites.pop(site_name, None)
+    
+    def _with_collection(self, site_name: str, operation: Callable[[Any], Any]) -> Any:
+        """Run an operation on a site's cached collection, refetching it once if it was deleted elsewhere"""
+        try:
+            return operation(self._get_collection(site_name))
+        except InvalidCollectionException:
+            self._forget_collection(site_name)
+            return operation(self._get_collection(site_name))
+    
+    def _add_batch(self, site_name: str, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]]):
+        """Add one batch of chunks, recreating the collection once if it was deleted elsewhere"""
+        try:
+            self._get_or_create_site_collection(site_name).add(documents=texts, metadatas=metadatas, ids=ids)
+        except InvalidCollectionException:
+            self._forget_collection(site_name)
+            collection = self._get_or_create_site_collection(site_name)
+            
+            # Earlier batches went to the deleted collection, so only this batch still
+            # counts as seen; update in place, since _iter_chunks holds this set
+            seen_hashes = self._content_hashes.setdefault(site_name, set())
+            seen_hashes.clear()
+            seen_hashes.update(metadata['content_hash'] for metadata in metadatas)
+            
+            collection.add(documents=texts, metadatas=metadatas, ids=ids)
+    
     def add_documents(self, documents: List[Dict[str, Any]], chunk_size: int = 1000, site_name: Optional[str] = None):
         """Add documents to the vector store with site-wise organization"""
         if not documents:
@@ -93,12 +167,9 @@ class VectorStore:
         
         # Group documents by site if site_name not provided
         if site_name is None:
-            site_groups = {}
+            site_groups = defaultdict(list)
             for doc in documents:
-                doc_site = self._get_site_name(doc.get('url', ''))
-                if doc_site not in site_groups:
-                    site_groups[doc_site] = []
-                site_groups[doc_site].append(doc)
+                site_groups[_site_from_url(doc.get('url', ''))].append(doc)
             
             # Add documents for each site
             for site, site_docs in site_groups.items():
@@ -109,38 +180,37 @@ class VectorStore:
     def _add_documents_for_site(self, documents: List[Dict[str, Any]], site_name: str, chunk_size: int):
         """Add documents for a specific site"""
         # Get or create collection for this site
-        collection = self._get_or_create_site_collection(site_name)
+        self._get_or_create_site_collection(site_name)
         
         # Initialize content hashes for this site if not exists
         if site_name not in self._content_hashes:
             self._content_hashes[site_name] = set()
         
-        # Process documents into chunks with deduplication
-        chunks = self._chunk_documents_optimized(documents, chunk_size, site_name)
-        
-        if not chunks:
-            logger.warning(f"No unique chunks to add for site {site_name}")
-            return
-        
-        # Prepare data for ChromaDB
+        # Stream deduplicated chunks into the collection in fixed-size batches
         ids = []
         texts = []
         metadatas = []
+        total_added = 0
         
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"{site_name}_chunk_{i}"
-            ids.append(chunk_id)
+        for chunk in self._iter_chunks(documents, chunk_size, site_name):
+            ids.append(f"{site_name}_chunk_{total_added + len(ids)}")
             texts.append(chunk['text'])
             metadatas.append(chunk['metadata'])
+            
+            if len(ids) >= ADD_BATCH_SIZE:
+                self._add_batch(site_name, ids, texts, metadatas)
+                total_added += len(ids)
+                ids, texts, metadatas = [], [], []
         
-        # Add to collection
-        collection.add(
-            documents=texts,
-            metadatas=metadatas,
-            ids=ids
-        )
+        if ids:
+            self._add_batch(site_name, ids, texts, metadatas)
+            total_added += len(ids)
         
-        logger.info(f"Added {len(chunks)} unique chunks to vector store for site {site_name}")
+        if not total_added:
+            logger.warning(f"No unique chunks to add for site {site_name}")
+            return
+        
+        logger.info(f"Added {total_added} unique chunks to vector store for site {site_name}")
     
     def _chunk_documents(self, documents: List[Dict[str, Any]], chunk_size: int) -> List[Dict[str, Any]]:
         """Split documents into chunks"""
@@ -203,10 +273,9 @@ class VectorStore:
         
         return chunks
     
-    def _chunk_documents_optimized(self, documents: List[Dict[str, Any]], chunk_size: int, site_name: str) -> List[Dict[str, Any]]:
-        """Split documents into chunks with deduplication and optimization"""
-        chunks = []
-        seen_hashes = self._content_hashes.get(site_name, set())
+    def _iter_chunks(self, documents: List[Dict[str, Any]], chunk_size: int, site_name: str) -> Iterator[Dict[str, Any]]:
+        """Yield document chunks with deduplication and optimization"""
+        seen_hashes = self._content_hashes.setdefault(site_name, set())
         
         for doc in documents:
             # Extract and optimize text content
@@ -235,7 +304,7 @@ class VectorStore:
                     
                     seen_hashes.add(chunk_hash)
                     
-                    chunks.append({
+                    yield {
                         'text': chunk_text,
                         'metadata': {
                             'url': doc.get('url', ''),
@@ -245,12 +314,7 @@ class VectorStore:
                             'content_hash': chunk_hash,
                             'site_name': site_name
                         }
-                    })
-        
-        # Update content hashes for this site
-        self._content_hashes[site_name] = seen_hashes
-        
-        return chunks
+                    }
     
     def _extract_optimized_text(self, doc: Dict[str, Any]) -> List[str]:
         """Extract text content with deduplication and optimization"""
@@ -357,21 +421,19 @@ class VectorStore:
                 logger.warning(f"Site {site_name} not found")
                 return []
             
-            collection = self.client.get_collection(self._available_sites[site_name])
-            results = collection.query(
+            results = self._with_collection(site_name, lambda c: c.query(
                 query_texts=[query],
                 n_results=n_results
-            )
+            ))
         else:
             # Search across all sites
             all_results = []
-            for site_name, collection_name in self._available_sites.items():
+            for site_name in list(self._available_sites):
                 try:
-                    collection = self.client.get_collection(collection_name)
-                    site_results = collection.query(
+                    site_results = self._with_collection(site_name, lambda c: c.query(
                         query_texts=[query],
                         n_results=n_results
-                    )
+                    ))
                     
                     # Add site information to results
                     for i in range(len(site_results['documents'][0])):
@@ -412,15 +474,7 @@ class VectorStore:
             return {'error': f'Site {site_name} not found'}
         
         try:
-            collection = self.client.get_collection(self._available_sites[site_name])
-            results = collection.get()
-            
-            total_chunks = len(results['documents'])
-            unique_hashes = set()
-            
-            for metadata in results['metadatas']:
-                if 'content_hash' in metadata:
-                    unique_hashes.add(metadata['content_hash'])
+            total_chunks, unique_hashes = self._with_collection(site_name, self._collect_content_hashes)
             
             return {
                 'site_name': site_name,
@@ -433,10 +487,24 @@ class VectorStore:
             logger.error(f"Error getting stats for site {site_name}: {e}")
             return {'error': str(e)}
     
+    def _collect_content_hashes(self, collection) -> tuple:
+        """Count a collection's chunks and gather their distinct content hashes"""
+        total_chunks = collection.count()
+        unique_hashes = set()
+        
+        # Only fetch metadata, page by page, instead of every document and embedding
+        for offset in range(0, total_chunks, STATS_PAGE_SIZE):
+            results = collection.get(include=["metadatas"], limit=STATS_PAGE_SIZE, offset=offset)
+            for metadata in results['metadatas']:
+                if metadata and 'content_hash' in metadata:
+                    unique_hashes.add(metadata['content_hash'])
+        
+        return total_chunks, unique_hashes
+    
     def get_all_sites_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all sites"""
         stats = {}
-        for site_name in self._available_sites:
+        for site_name in list(self._available_sites):
             stats[site_name] = self.get_site_stats(site_name)
         return stats
     
@@ -446,15 +514,13 @@ class VectorStore:
             if site_name not in self._available_sites:
                 return []
             
-            collection = self.client.get_collection(self._available_sites[site_name])
-            results = collection.get()
+            results = self._with_collection(site_name, lambda c: c.get())
         else:
             # Get from all sites
             all_results = []
-            for site_name, collection_name in self._available_sites.items():
+            for site_name in list(self._available_sites):
                 try:
-                    collection = self.client.get_collection(collection_name)
-                    site_results = collection.get()
+                    site_results = self._with_collection(site_name, lambda c: c.get())
                     
                     for i in range(len(site_results['documents'])):
                         all_results.append({
@@ -484,6 +550,7 @@ class VectorStore:
             collection_name = self._available_sites[site_name]
             self.client.delete_collection(collection_name)
             del self._available_sites[site_name]
+            self._collections.pop(site_name, None)
             if site_name in self._content_hashes:
                 del self._content_hashes[site_name]
             logger.info(f"Cleared vector store for site {site_name}")
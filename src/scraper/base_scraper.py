@@ -1,14 +1,15 @@
 import asyncio
-import json
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin, urlparse
 import aiofiles
+import aiohttp
 from bs4 import BeautifulSoup
+import orjson
 import requests
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Route
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -18,9 +19,19 @@ import time
 from loguru import logger
 
 
+# Maximum number of in-flight requests for batched async fetching
+ASYNC_FETCH_CONCURRENCY = 32
+
+# Resource types Playwright pages never need for content extraction
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+
 class BaseScraper(ABC):
     """Base class for all web scrapers"""
     
+    # Extra Chromium flags for the shared Playwright browser
+    browser_args: List[str] = []
+    
     def __init__(self, base_url: str, output_dir: str = "data/raw"):
         self.base_url = base_url
         self.output_dir = Path(output_dir)
@@ -32,6 +43,13 @@ class BaseScraper(ABC):
         self.visited_urls = set()
         self.data = []
         
+        # Shared Playwright browser, launched lazily and bound to one event loop
+        self._playwright = None
+        self._browser = None
+        self._browser_loop = None
+        self._browser_lock = None
+        self._context = None
+        
     def get_page_content(self, url: str) -> Optional[str]:
         """Get page content using requests with better timeout handling"""
         try:
@@ -49,6 +67,35 @@ class BaseScraper(ABC):
             logger.error(f"Error fetching {url}: {e}")
             return None
     
+    async def get_pages(self, urls: List[str], concurrency: int = ASYNC_FETCH_CONCURRENCY) -> Dict[str, Optional[str]]:
+        """Get content for many pages concurrently using a single aiohttp session"""
+        semaphore = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(sock_connect=10, sock_read=30)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            contents = await asyncio.gather(*(self._fetch_page(session, semaphore, url) for url in urls))
+        
+        return dict(zip(urls, contents))
+    
+    async def _fetch_page(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str) -> Optional[str]:
+        """Fetch a single page within the shared session"""
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.text()
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout fetching {url}")
+                return None
+            except aiohttp.ClientConnectionError:
+                logger.warning(f"Connection error fetching {url}")
+                return None
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+    
     def get_page_with_selenium(self, url: str, wait_time: int = 10) -> Optional[str]:
         """Get page content using Selenium for JavaScript-heavy sites"""
         options = Options()
@@ -79,44 +126,120 @@ class BaseScraper(ABC):
             if driver:
                 driver.quit()
     
+    async def _ensure_browser(self) -> Browser:
+        """Launch the shared Playwright browser on first use"""
+        loop = asyncio.get_running_loop()
+        if self._browser_loop is not loop:
+            # Handles from another event loop cannot be reused; switch first so
+            # concurrent callers on this loop don't also try to release them
+            stale = (self._browser_loop, self._context, self._browser, self._playwright)
+            self._playwright = None
+            self._browser = None
+            self._context = None
+            self._browser_loop = loop
+            self._browser_lock = asyncio.Lock()
+            await self._release_stale_browser(*stale)
+        
+        # Concurrent first calls on one loop must not launch several browsers
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True, args=self.browser_args)
+        
+        return self._browser
+    
+    async def _ensure_context(self) -> BrowserContext:
+        """Create the shared browser context for get_page_with_playwright on first use"""
+        browser = await self._ensure_browser()
+        async with self._browser_lock:
+            # A relaunched browser invalidates the old context
+            if self._context is None or self._context.browser is not browser:
+                context = await browser.new_context()
+                await context.route("**/*", self._block_resources)
+                self._context = context
+        return self._context
+    
+    async def _release_stale_browser(self, loop: Optional[asyncio.AbstractEventLoop], context: Optional[BrowserContext],
+                                     browser: Optional[Browser], playwright) -> None:
+        """Close Playwright handles left behind on another event loop"""
+        if playwright is None:
+            return
+        if loop is None or loop.is_closed() or not loop.is_running():
+            logger.warning("Playwright browser belongs to an event loop that is no longer running; it may be left behind")
+            return
+        try:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._close_handles(context, browser, playwright), loop))
+        except Exception as e:
+            logger.warning(f"Error closing Playwright browser from another event loop: {e}")
+    
+    async def _close_handles(self, context: Optional[BrowserContext], browser: Optional[Browser], playwright) -> None:
+        """Close a context, browser and Playwright driver on the loop that created them"""
+        if context is not None:
+            await context.close()
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+    
+    async def _block_resources(self, route: Route):
+        """Abort requests for resources that don't affect page content"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def get_page_with_playwright(self, url: str) -> Optional[str]:
         """Get page content using Playwright for complex sites"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until='networkidle')
-                
-                # Scroll to load lazy content
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(2000)
-                
-                content = await page.content()
-                await browser.close()
-                return content
-            except Exception as e:
-                logger.error(f"Error fetching {url} with Playwright: {e}")
-                await browser.close()
-                return None
+        # Pages share one context instead of each creating (and routing) its own
+        context = await self._ensure_context()
+        page = None
+        try:
+            page = await context.new_page()
+            await page.goto(url, wait_until='networkidle')
+            
+            # Scroll to load lazy content
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await page.wait_for_timeout(2000)
+            
+            return await page.content()
+        except Exception as e:
+            logger.error(f"Error fetching {url} with Playwright: {e}")
+            return None
+        finally:
+            if page:
+                await page.close()
+    
+    async def shutdown(self):
+        """Close the shared Playwright browser"""
+        handles = (self._context, self._browser, self._playwright)
+        self._context = None
+        self._browser = None
+        self._playwright = None
+        self._browser_loop = None
+        await self._close_handles(*handles)
     
     def extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extract all links from a page"""
-        links = []
+        base_netloc = urlparse(base_url).netloc
+        
+        # Dict keys dedupe links while keeping them in page order
+        links = {}
         for link in soup.find_all('a', href=True):
             href = link['href']
             absolute_url = urljoin(base_url, href)
             
             # Only include links from the same domain
-            if urlparse(absolute_url).netloc == urlparse(base_url).netloc:
-                links.append(absolute_url)
+            if absolute_url not in links and urlparse(absolute_url).netloc == base_netloc:
+                links[absolute_url] = None
         
-        return list(set(links))
+        return list(links)
     
     def save_to_json(self, data: List[Dict], filename: str):
         """Save data to JSON file"""
         filepath = self.output_dir / f"{filename}.json"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         logger.info(f"Data saved to {filepath}")
     
     def save_to_markdown(self, data: List[Dict], filename: str):
@@ -4,38 +4,65 @@ Data Processor for Web Scraper - Cleans and structures raw scraped data
 """
 
 import json
+import multiprocessing
 import re
 import time
-from typing import List, Dict, Any, Optional
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from pathlib import Path
+import orjson
 from loguru import logger
 
 
+# Minimum number of pages before processing is spread across worker processes
+PARALLEL_PAGE_THRESHOLD = 4
+
+# Pages up to this many characters have their extracted categories cached,
+# since crawls often revisit the same listing content
+CATEGORY_CACHE_MAX_CONTENT = 200_000
+CATEGORY_CACHE_SIZE = 256
+
+
 class DataProcessor:
     """Processes and structures raw scraped data"""
     
     def __init__(self):
-        self.product_patterns = [
-            # Pattern for products with specifications like "Samsung Galaxy S25 Plus 12GB RAM 256GB Rs. 294,000.00"
-            r'([A-Za-z\s]+(?:\s+\d+[A-Za-z]*)?(?:\s+[A-Za-z]+)*)\s+\d+[A-Za-z]*\s+RAM\s+\d+[A-Za-z]*\s+Rs\.\s*([\d,]+\.?\d*)',
-            # Pattern for products with just name and price like "JBL Flip 6 Original Bluetooth Speaker Rs. 48,900.00"
-            r'([A-Za-z\s]+(?:\s+\d+[A-Za-z]*)?(?:\s+[A-Za-z]+)*)\s+Rs\.\s*([\d,]+\.?\d*)',
-            # Pattern for products with simple specs like "Apple iPhone 16 128GB Rs. 369,900.00"
-            r'([A-Za-z\s]+(?:\s+\d+[A-Za-z]*)?(?:\s+[A-Za-z]+)*)\s+\d+[A-Za-z]*\s+Rs\.\s*([\d,]+\.?\d*)',
-            # More flexible pattern for any product name followed by price
-            r'([A-Za-z\s]+(?:\s+\d+[A-Za-z]*)?(?:\s+[A-Za-z]+)*)\s+Rs\.\s*([\d,]+\.?\d*)',
-        ]
-        
-        self.price_patterns = [
+        # What may follow a product name, tried in order: "12GB RAM 256GB Rs. ...",
+        # "Rs. ..." and "128GB Rs. ...". The name itself is found by scanning back
+        # from the match (see _find_product_name_start) instead of a leading
+        # `([A-Za-z\s]+(?:\s+\d+[A-Za-z]*)?(?:\s+[A-Za-z]+)*)` group, which
+        # backtracks polynomially on long blocks without a price.
+        self._product_suffix_patterns = [re.compile(p, re.IGNORECASE) for p in [
+            r'(?<=\s)\d+[A-Za-z]*\s+RAM\s+\d+[A-Za-z]*\s+Rs\.\s*([\d,]+\.?\d*)',
+            r'(?<=\s)Rs\.\s*([\d,]+\.?\d*)',
+            r'(?<=\s)\d+[A-Za-z]*\s+Rs\.\s*([\d,]+\.?\d*)',
+        ]]
+        self._name_run_re = re.compile(r'[A-Za-z\s]*', re.IGNORECASE)
+        self._digit_run_re = re.compile(r'\d*')
+        
+        self.price_patterns = [re.compile(p) for p in [
             r'Rs\.\s*([\d,]+\.?\d*)',
             r'Original price was:\s*Rs\.\s*([\d,]+\.?\d*)\.\s*Rs\.\s*([\d,]+\.?\d*)',
             r'Current price is:\s*Rs\.\s*([\d,]+\.?\d*)',
-        ]
+        ]]
         
-        self.discount_patterns = [
+        self.discount_patterns = [re.compile(p) for p in [
             r'-(\d+)%',
             r'(\d+)%\s+off',
-        ]
+        ]]
+        
+        # Frequently used patterns, compiled once
+        self._price_re = re.compile(r'Rs\.\s*([\d,]+\.?\d*)')
+        self._orig_price_re = re.compile(r'Original price was:\s*Rs\.\s*([\d,]+\.?\d*)\.\s*Rs\.\s*([\d,]+\.?\d*)')
+        self._orig_price_only_re = re.compile(r'Original price was:\s*Rs\.\s*([\d,]+\.?\d*)')
+        self._spec_re = re.compile(r'(\d+[A-Za-z]*\s+RAM\s+\d+[A-Za-z]*)')
+        self._ws_re = re.compile(r'\s+')
+        self._boilerplate_re = re.compile(
+            r'This product has multiple variants\. The options may be chosen on the product page'
+            r'|Add to compare|Quick view|Add to wishlist|Select options'
+        )
         
         self.section_patterns = [
             r'LATEST MOBILE PHONES',
@@ -47,6 +74,11 @@ class DataProcessor:
             r'EARBUDS',
         ]
         
+        # Lower-cased headings for plain substring search, and a regex fallback
+        self._section_needles = [(pattern.lower(), pattern) for pattern in self.section_patterns]
+        self._section_re = re.compile('|'.join(map(re.escape, self.section_patterns)), re.IGNORECASE)
+        self._section_names = {pattern.upper(): pattern for pattern in self.section_patterns}
+        
         # Common product separators
         self.product_separators = [
             'Add to compare',
@@ -58,6 +90,18 @@ class DataProcessor:
             'New',
             'Best Seller'
         ]
+        self._separator_re = re.compile('|'.join(map(re.escape, self.product_separators)))
+        
+        # Common feature keywords
+        self.feature_keywords = [
+            'New', 'Best Seller', 'Popular', 'Featured', 'Limited Time',
+            'Free Shipping', 'Warranty', 'Gift', 'Bundle', 'Deal'
+        ]
+        self._feature_re = re.compile('|'.join(map(re.escape, self.feature_keywords)), re.IGNORECASE | re.ASCII)
+        self._feature_order = tuple((keyword.lower(), keyword) for keyword in self.feature_keywords)
+        
+        # Per-instance cache of category extraction results keyed on page content
+        self._cached_categories = lru_cache(maxsize=CATEGORY_CACHE_SIZE)(self._extract_frozen_categories)
     
     def process_raw_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process raw scraped data into structured format"""
@@ -70,63 +114,99 @@ class DataProcessor:
             'processing_timestamp': time.time()
         }
         
-        for page in raw_data.get('pages', []):
-            processed_page = self._process_page(page)
-            if processed_page:
-                processed_data['processed_pages'].append(processed_page)
-                
-                # Extract products from page
-                page_products = self._extract_products_from_content(page.get('content', ''))
-                processed_data['products'].extend(page_products)
-                
-                # Extract categories
-                page_categories = self._extract_categories_from_content(page.get('content', ''))
-                for category, products in page_categories.items():
-                    if category not in processed_data['categories']:
-                        processed_data['categories'][category] = []
-                    processed_data['categories'][category].extend(products)
+        pages = raw_data.get('pages', [])
+        
+        # Pages are independent, so large batches are spread across processes.
+        # Daemonic processes (e.g. Celery prefork workers) cannot start children.
+        if len(pages) < PARALLEL_PAGE_THRESHOLD or multiprocessing.current_process().daemon:
+            self._merge_page_results(processed_data, map(self._process_single_page, pages))
+        else:
+            with ProcessPoolExecutor(initializer=_init_page_worker, initargs=(type(self),)) as executor:
+                results = executor.map(_process_page_in_worker, pages, chunksize=8)
+                self._merge_page_results(processed_data, results)
         
         return processed_data
     
-    def _process_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_single_page(self, page: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Process one page into its summary, products and categories"""
+        content = page.get('content', '')
+        
+        # Extract categories once; the page's products are the same lists flattened
+        page_categories = self._extract_categories_from_content(content)
+        page_products = [product for products in page_categories.values() for product in products]
+        
+        processed_page = self._process_page(page, content, len(page_products), len(page_categories))
+        return processed_page, page_products, page_categories
+    
+    def _merge_page_results(self, processed_data: Dict[str, Any], results: Iterable[tuple]):
+        """Merge per-page results into the processed data, in page order"""
+        for processed_page, page_products, page_categories in results:
+            processed_data['processed_pages'].append(processed_page)
+            processed_data['products'].extend(page_products)
+            
+            for category, products in page_categories.items():
+                processed_data['categories'].setdefault(category, []).extend(products)
+    
+    def _process_page(self, page: Dict[str, Any], content: str, products_count: int, categories_count: int) -> Dict[str, Any]:
         """Process individual page data"""
         return {
             'url': page.get('url', ''),
             'title': page.get('title', ''),
-            'content_summary': self._generate_content_summary(page.get('content', '')),
-            'products_count': len(self._extract_products_from_content(page.get('content', ''))),
-            'categories_count': len(self._extract_categories_from_content(page.get('content', ''))),
+            'content_summary': self._generate_content_summary(content),
+            'products_count': products_count,
+            'categories_count': categories_count,
             'metadata': page.get('metadata', {}),
             'timestamp': page.get('timestamp', 0)
         }
     
-    def _extract_products_from_content(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_products_from_content(self, content: str) -> Iterator[Dict[str, Any]]:
         """Extract structured product information from content"""
-        products = []
+        # Pages without a price can't contain products; skip the regex work
+        if 'Rs.' not in content:
+            return
         
         # Split content into sections
         sections = self._split_into_sections(content)
         
         for section_name, section_content in sections.items():
             # Extract products from each section
-            section_products = self._extract_products_from_section(section_content, section_name)
-            products.extend(section_products)
-        
-        return products
+            yield from self._extract_products_from_section(section_content, section_name)
     
-    def _split_into_sections(self, content: str) -> Dict[str, str]:
-        """Split content into logical sections"""
-        sections = {}
+    def _find_section_positions(self, content: str) -> List[tuple]:
+        """Find the first (position, pattern) of each section heading, in content order"""
+        lowered = content.lower()
+        if len(lowered) != len(content):
+            # Some characters lower-case to several, so offsets no longer line up
+            return self._find_section_positions_re(content)
         
-        # Find all section positions
         section_positions = []
-        for pattern in self.section_patterns:
-            if pattern.lower() in content.lower():
-                pos = content.lower().find(pattern.lower())
+        for needle, pattern in self._section_needles:
+            pos = lowered.find(needle)
+            if pos >= 0:
                 section_positions.append((pos, pattern))
         
-        # Sort by position
         section_positions.sort()
+        return section_positions
+    
+    def _find_section_positions_re(self, content: str) -> List[tuple]:
+        """Find section headings with the case-insensitive regex"""
+        section_positions = []
+        found = set()
+        for match in self._section_re.finditer(content):
+            pattern = self._section_names[match.group().upper()]
+            if pattern not in found:
+                found.add(pattern)
+                section_positions.append((match.start(), pattern))
+                if len(found) == len(self.section_patterns):
+                    break
+        
+        return section_positions
+    
+    def _split_into_sections(self, content: str) -> Dict[str, str]:
+        """Split content into logical sections"""
+        sections = {}
+        
+        section_positions = self._find_section_positions(content)
         
         if not section_positions:
             # No sections found, put everything in General
@@ -153,19 +233,15 @@ class DataProcessor:
         
         return sections
     
-    def _extract_products_from_section(self, section_content: str, section_name: str) -> List[Dict[str, Any]]:
+    def _extract_products_from_section(self, section_content: str, section_name: str) -> Iterator[Dict[str, Any]]:
         """Extract products from a specific section"""
-        products = []
-        
-        # First, try to find all price patterns in the content
-        price_matches = re.findall(r'Rs\.\s*([\d,]+\.?\d*)', section_content)
-        
-        if not price_matches:
-            return products
+        # First, make sure the section has any prices at all
+        if not self._price_re.search(section_content):
+            return
         
         # Split content by product separators
-        separator_pattern = '|'.join(map(re.escape, self.product_separators))
-        product_blocks = re.split(f'(?:{separator_pattern})', section_content)
+        product_blocks = self._separator_re.split(section_content)
+        found = False
         
         for block in product_blocks:
             if not block.strip():
@@ -174,13 +250,12 @@ class DataProcessor:
             # Try to extract product from this block
             product = self._parse_product_block(block.strip(), section_name)
             if product and product['name']:
-                products.append(product)
+                found = True
+                yield product
         
         # If we didn't find products by splitting, try a different approach
-        if not products:
-            products = self._extract_products_by_price_context(section_content, section_name)
-        
-        return products
+        if not found:
+            yield from self._extract_products_by_price_context(section_content, section_name)
     
     def _parse_product_block(self, block: str, category: str) -> Optional[Dict[str, Any]]:
         """Parse a product block into structured data"""
@@ -196,13 +271,9 @@ class DataProcessor:
         }
         
         # Extract product name and specifications
-        for pattern in self.product_patterns:
-            matches = re.findall(pattern, block, re.IGNORECASE)
-            if matches:
-                if len(matches[0]) >= 2:
-                    product['name'] = matches[0][0].strip()
-                    product['current_price'] = matches[0][1].strip()
-                break
+        match = self._match_product_name(block)
+        if match:
+            product['name'], product['current_price'] = match
         
         # Extract pricing information
         price_info = self._extract_pricing_info(block)
@@ -225,18 +296,52 @@ class DataProcessor:
         
         return None
     
+    def _match_product_name(self, block: str) -> Optional[Tuple[str, str]]:
+        """Find the first product name and price in a block"""
+        reversed_block = block[::-1]
+        for pattern in self._product_suffix_patterns:
+            for match in pattern.finditer(block):
+                # Every suffix ends in "Rs.", so no name can span two matches
+                start = self._find_product_name_start(reversed_block, match.start())
+                if start is not None:
+                    return block[start:match.start()].strip(), match.group(1).strip()
+        return None
+    
+    def _find_product_name_start(self, reversed_block: str, end: int) -> Optional[int]:
+        """Find where the longest product name ending at `end` starts.
+        
+        A name is letters and whitespace with at most one "128GB"-style token,
+        and is followed by whitespace. Runs are measured on the reversed block
+        so each check is a single forward match.
+        """
+        length = len(reversed_block)
+        
+        # Letters and whitespace directly before the suffix
+        run_start = end - len(self._name_run_re.match(reversed_block, length - end).group())
+        
+        # Prefer extending over a preceding number token, e.g. "Galaxy S25 Plus"
+        digits_start = run_start - len(self._digit_run_re.match(reversed_block, length - run_start).group())
+        if digits_start < run_start and digits_start > 0 and reversed_block[length - digits_start].isspace():
+            name_start = digits_start - len(self._name_run_re.match(reversed_block, length - digits_start).group())
+            if digits_start - name_start >= 2:
+                return name_start
+        
+        if end - run_start >= 2:
+            return run_start
+        return None
+    
     def _extract_pricing_info(self, block: str) -> Dict[str, str]:
         """Extract pricing information from product block"""
         pricing = {}
         
         # Look for original and current prices
-        price_matches = re.findall(r'Original price was:\s*Rs\.\s*([\d,]+\.?\d*)\.\s*Rs\.\s*([\d,]+\.?\d*)', block)
+        price_matches = self._orig_price_re.findall(block)
         if price_matches:
             pricing['original_price'] = price_matches[0][0]
             pricing['current_price'] = price_matches[0][1]
         else:
             # Look for single price
-            single_price = re.search(r'Rs\.\s*([\d,]+\.?\d*)', block)
+            single_price = self._price_re.search(block)
             if single_price:
                 pricing['current_price'] = single_price.group(1)
         
@@ -245,34 +350,27 @@ class DataProcessor:
     def _extract_discount_info(self, block: str) -> str:
         """Extract discount percentage from product block"""
         for pattern in self.discount_patterns:
-            match = re.search(pattern, block)
+            match = pattern.search(block)
             if match:
                 return match.group(1)
         return ""
     
     def _extract_features(self, block: str) -> List[str]:
         """Extract product features from block"""
-        features = []
-        
-        # Common feature keywords
-        feature_keywords = [
-            'New', 'Best Seller', 'Popular', 'Featured', 'Limited Time',
-            'Free Shipping', 'Warranty', 'Gift', 'Bundle', 'Deal'
-        ]
+        # Find every keyword in one case-insensitive pass, report them in keyword order
+        found = {match.group().lower() for match in self._feature_re.finditer(block)}
+        if not found:
+            return []
         
-        for keyword in feature_keywords:
-            if keyword.lower() in block.lower():
-                features.append(keyword)
-        
-        return features
+        return [keyword for lowered, keyword in self._feature_order if lowered in found]
     
-    def _extract_products_by_price_context(self, content: str, category: str) -> List[Dict[str, Any]]:
+    def _extract_products_by_price_context(self, content: str, category: str) -> Iterator[Dict[str, Any]]:
         """Extract products by looking at text around price patterns"""
-        products = []
-        
-        # Find all price occurrences with their context
-        price_pattern = r'Rs\.\s*([\d,]+\.?\d*)'
-        price_matches = list(re.finditer(price_pattern, content))
+        # Scan the whole content once per pattern instead of re-scanning each price's context
+        price_matches = list(self._price_re.finditer(content))
+        original_price_matches = list(self._orig_price_only_re.finditer(content))
+        discount_matches = [list(pattern.finditer(content)) for pattern in self.discount_patterns]
+        seen = set()
         
         for match in price_matches:
             price = match.group(1)
@@ -297,12 +395,14 @@ class DataProcessor:
                 }
                 
                 # Extract additional information
-                discount_info = self._extract_discount_info(context)
-                if discount_info:
-                    product['discount_percentage'] = discount_info
+                for matches in discount_matches:
+                    discount_match = self._first_match_in_window(matches, start_pos, end_pos)
+                    if discount_match:
+                        product['discount_percentage'] = discount_match.group(1)
+                        break
                 
                 # Check for original price
-                original_price_match = re.search(r'Original price was:\s*Rs\.\s*([\d,]+\.?\d*)', context)
+                original_price_match = self._first_match_in_window(original_price_matches, start_pos, end_pos)
                 if original_price_match:
                     product['original_price'] = original_price_match.group(1)
                 
@@ -312,10 +412,18 @@ class DataProcessor:
                     product['features'] = features
                 
                 # Only add if we don't already have this product
-                if not any(p['name'] == product_name and p['current_price'] == price for p in products):
-                    products.append(product)
-        
-        return products
+                key = (product_name, price)
+                if key not in seen:
+                    seen.add(key)
+                    yield product
+    
+    @staticmethod
+    def _first_match_in_window(matches: List[re.Match], start: int, end: int) -> Optional[re.Match]:
+        """Return the first of position-ordered matches lying entirely within [start, end)"""
+        index = bisect_left(matches, start, key=re.Match.start)
+        if index < len(matches) and matches[index].end() <= end:
+            return matches[index]
+        return None
     
     def _extract_product_name_from_context(self, context: str, price_position: int) -> str:
         """Extract product name from context around price"""
@@ -323,18 +431,18 @@ class DataProcessor:
         before_price = context[:price_position].strip()
         
         # Clean up the context by removing common boilerplate
-        before_price = re.sub(r'This product has multiple variants\. The options may be chosen on the product page', '', before_price)
-        before_price = re.sub(r'Add to compare|Quick view|Add to wishlist|Select options', '', before_price)
-        before_price = re.sub(r'\s+', ' ', before_price).strip()
+        before_price = self._boilerplate_re.sub('', before_price)
+        before_price = self._ws_re.sub(' ', before_price).strip()
         
         # Look for specifications pattern like "12GB RAM 256GB"
-        spec_match = re.search(r'(\d+[A-Za-z]*\s+RAM\s+\d+[A-Za-z]*)', before_price)
+        spec_match = self._spec_re.search(before_price)
         if spec_match:
             # Get text before the specification
             before_spec = before_price[:spec_match.start()].strip()
             if before_spec:
-                # Take the last few words as the product name
-                words = before_spec.split()
+                # Take the last few words as the product name; rsplit stops
+                # after the words we need instead of splitting the whole prefix
+                words = before_spec.rsplit(None, 3)
                 if len(words) >= 2:
                     # Take last 2-4 words as product name
                     name = ' '.join(words[-3:]) if len(words) >= 3 else ' '.join(words)
@@ -342,7 +450,7 @@ class DataProcessor:
                         return name
         
         # If no specifications found, try to extract just product name
-        words = before_price.split()
+        words = before_price.rsplit(None, 2)
         if len(words) >= 2:
             # Take last 2-3 words as product name
             name = ' '.join(words[-2:]) if len(words) >= 2 else ' '.join(words)
@@ -353,33 +461,51 @@ class DataProcessor:
     
     def _extract_categories_from_content(self, content: str) -> Dict[str, List[Dict[str, Any]]]:
         """Extract products organized by categories"""
-        categories = {}
+        # Pages without a price can't contain products; skip the regex work
+        if 'Rs.' not in content:
+            return {}
+        
+        if len(content) >= CATEGORY_CACHE_MAX_CONTENT:
+            frozen = self._extract_frozen_categories(content)
+        else:
+            frozen = self._cached_categories(content)
+        
+        # Hand out fresh containers so callers can't modify the cached result
+        return {
+            section_name: [{**product, 'features': list(product['features'])} for product in products]
+            for section_name, products in frozen
+        }
+    
+    def _extract_frozen_categories(self, content: str) -> Tuple[Tuple[str, Tuple[Dict[str, Any], ...]], ...]:
+        """Extract categories as nested tuples suitable for caching"""
+        categories = []
         
         sections = self._split_into_sections(content)
         
         for section_name, section_content in sections.items():
-            products = self._extract_products_from_section(section_content, section_name)
+            products = tuple(self._extract_products_from_section(section_content, section_name))
             if products:
-                categories[section_name] = products
+                categories.append((section_name, products))
         
-        return categories
+        return tuple(categories)
     
     def _generate_content_summary(self, content: str) -> str:
         """Generate a summary of the content"""
         if not content:
             return ""
         
-        # Count products
-        product_count = len(re.findall(r'Rs\.\s*[\d,]+\.?\d*', content))
+        # Count products; the same scan supplies the prices for the range below
+        prices = self._price_re.findall(content)
+        product_count = len(prices)
         
         # Count categories
-        category_count = len([p for p in self.section_patterns if p.lower() in content.lower()])
+        category_count = len(self._find_section_positions(content))
         
         # Get price range
-        prices = re.findall(r'Rs\.\s*([\d,]+\.?\d*)', content)
         if prices:
-            # Convert to numbers for comparison
-            price_numbers = [float(p.replace(',', '')) for p in prices if p.replace(',', '').replace('.', '').isdigit()]
+            # Convert to numbers for comparison, stripping separators once per price
+            numbers = (p.replace(',', '') for p in prices)
+            price_numbers = [float(n) for n in numbers if n.replace('.', '').isdigit()]
             if price_numbers:
                 min_price = min(price_numbers)
                 max_price = max(price_numbers)
@@ -396,8 +522,7 @@ class DataProcessor:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(processed_data, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(orjson.dumps(processed_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"Processed data saved to {output_file}")
         return str(output_file)
@@ -444,13 +569,32 @@ class DataProcessor:
         return '\n'.join(summary)
 
 
+# Per-process processor used by ProcessPoolExecutor workers
+_worker_processor = None
+
+
+def _init_page_worker(processor_class: type):
+    """Create the processor instance for a worker process"""
+    global _worker_processor
+    _worker_processor = processor_class()
+
+
+def _process_page_in_worker(page: Dict[str, Any]) -> tuple:
+    """Process a single page inside a worker process"""
+    return _worker_processor._process_single_page(page)
+
+
 def process_raw_file(input_file: str, output_file: str = None) -> str:
     """Process a raw scraped file and create structured output"""
     processor = DataProcessor()
     
     # Read raw data
-    with open(input_file, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+    raw_bytes = Path(input_file).read_bytes()
+    try:
+        raw_data = orjson.loads(raw_bytes)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than json (e.g. NaN, integers beyond 64 bits)
+        raw_data = json.loads(raw_bytes)
     
     # Process the data
     processed_data = processor.process_raw_data(raw_data)
@@ -466,9 +610,7 @@ def process_raw_file(input_file: str, output_file: str = None) -> str:
     # Create and save readable summary
     summary = processor.create_readable_summary(processed_data)
     summary_file = str(Path(output_file).with_suffix('.summary.txt'))
-    
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(summary)
+    Path(summary_file).write_text(summary, encoding='utf-8')
     
     logger.info(f"Processing complete!")
     logger.info(f"Processed data: {output_file}")
@@ -6,17 +6,26 @@ Super Universal Web Scraper - Advanced scraping with Selenium, Playwright, and Q
 import os
 import json
 import time
-import hashlib
-import threading
-import queue
 import asyncio
-from typing import List, Dict, Any, Optional, Set
-from urllib.parse import urljoin, urlparse
+import re
+import random
+import threading
+from collections import Counter, defaultdict
+import multiprocessing
+from typing import List, Dict, Any, Optional, Set, Union, AsyncIterator, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import aiohttp
+import orjson
+from bs4 import BeautifulSoup, Tag
+import soupsieve
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from blake3 import blake3
 from loguru import logger
+from rbloom import Bloom
 
 # Selenium imports
 from selenium import webdriver
@@ -27,17 +36,124 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 # Playwright imports
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import BrowserContext, TimeoutError as PlaywrightTimeoutError
 
 from .base_scraper import BaseScraper
 
 
+# Bloom filters for seen URLs/content are sized to this many entries per page
+SEEN_BLOOM_ITEMS_PER_PAGE = 8
+
+# False positive rate of the seen filters; a false positive just skips a page
+SEEN_BLOOM_FALSE_POSITIVE_RATE = 1e-7
+
+# Selenium drivers are restarted after this many pages to shed leaked memory
+SELENIUM_RECYCLE_PAGES = 200
+
+# Minimum page limit before parsing is spread across worker processes
+PARSE_POOL_MIN_PAGES = 50
+
+# Minimum number of pages before RAG optimization is spread across worker processes
+OPTIMIZE_POOL_MIN_PAGES = 1000
+
+# Worker processes never fork the (multi-threaded) scraper process directly
+PROCESS_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Responses worth retrying with backoff
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Longest single retry backoff, in seconds, however slow REQUEST_DELAY makes the schedule
+RETRY_BACKOFF_MAX = 30.0
+
+# Ports dropped from URLs because they are the scheme's default
+DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+# File extensions that mark a quoted JavaScript string as a likely URL
+JS_URL_EXTENSIONS = [
+    'html?', 'php', 'aspx', 'jsp', 'asp', 'cgi', 'pl', 'py', 'rb', 'cs', 'java', 'go', 'rs',
+    'swift', 'kt', 'scala', 'clj', 'hs', 'ml', 'fs', 'v', 'vhd', 'sv', 'vbs', 'ps1', 'sh',
+    'bat', 'cmd', 'exe', 'dll', 'so', 'dylib', 'a', 'lib', 'o', 'obj', 'class', 'jar', 'war',
+    'ear', 'apk', 'ipa', 'deb', 'rpm', 'msi', 'pkg', 'dmg', 'iso', 'img', 'vmdk', 'vdi', 'vhdx',
+    'ova', 'ovf',
+]
+
+# One pass over a script for all extensions, plus the general path pattern
+JS_FILE_URL_RE = re.compile(r'["\']([^"\']*\.(?:' + '|'.join(JS_URL_EXTENSIONS) + r')[^"\']*)["\']')
+JS_PATH_URL_RE = re.compile(r'"/([^"]*)"')
+
+# Common words ignored when picking a page's key topics
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+
+# Tag index key for elements carrying a data-url attribute; not a valid tag name
+DATA_URL_KEY = '[data-url]'
+
+# Page type keywords, checked in order against the URL (and content for products)
+PRODUCT_URL_KEYWORDS = ('product', 'item', 'goods', 'buy', 'shop')
+PRODUCT_CONTENT_KEYWORDS = ('price', 'add to cart', 'buy now', 'product')
+CATEGORY_URL_KEYWORDS = ('category', 'catalog', 'collection')
+CONTACT_URL_KEYWORDS = ('contact', 'about', 'company')
+ARTICLE_URL_KEYWORDS = ('blog', 'article', 'news', 'post')
+
+# Main content containers, highest priority first
+MAIN_CONTENT_SELECTORS = [
+    'main', 'article', '.content', '.main-content', '.post-content', '.entry-content',
+    '#content', '#main', '.post', '.article', '[role="main"]', '.container',
+    '.wrapper', '.page-content', '.site-content', '.primary-content'
+]
+
+# One selector finds every candidate in a single tree walk; the per-selector
+# matchers then rank the candidates so the priority order above still wins
+MAIN_CONTENT_SELECTOR = soupsieve.compile(', '.join(MAIN_CONTENT_SELECTORS))
+MAIN_CONTENT_MATCHERS = [soupsieve.compile(selector) for selector in MAIN_CONTENT_SELECTORS]
+
+# Substrings marking a URL as non-content, matched in one pass
+NON_CONTENT_URL_PATTERNS = [
+    '/admin', '/login', '/logout', '/register', '/signup',
+    '/api/', '/ajax/', '/json/', '/xml/', '/rss',
+    '/sitemap', '/robots.txt', '/favicon.ico',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx',
+    '.zip', '.rar', '.tar', '.gz',
+    'mailto:', 'tel:', 'javascript:'
+]
+NON_CONTENT_URL_RE = re.compile('|'.join(map(re.escape, NON_CONTENT_URL_PATTERNS)))
+
+# Common boilerplate removed from page text, applied in order. Literal phrases
+# share a pass; the "up to the next period" patterns keep their own passes
+# because what they swallow depends on what was removed before them.
+# "follow us on" also covers the per-network variants, which it used to
+# strip before they could match.
+BOILERPLATE_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r'cookie policy|privacy policy|terms of service',
+    r'© \d{4}.*?\.',
+    r'all rights reserved',
+    r'powered by.*?\.',
+    r'loading\.\.\.|please wait\.\.\.|javascript required|this site uses cookies|accept cookies'
+    r'|decline cookies|subscribe to newsletter|newsletter signup|follow us on|like us on facebook',
+]]
+WHITESPACE_RE = re.compile(r'\s+')
+
+
 class UniversalScraper(BaseScraper):
     """Super universal scraper with advanced capabilities"""
     
+    browser_args = [
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-web-security'
+    ]
+    
     def __init__(self, base_url: str, output_dir: str = "data/raw", expected_pages: int = None, progress_callback=None):
         super().__init__(base_url, output_dir)
         
+        # Parsed once; every extracted link is compared against it
+        self._base_netloc = urlsplit(base_url).netloc
+        
         # Configuration from environment variables
         self.max_pages = int(os.getenv("MAX_PAGES", "100"))
         self.max_workers = int(os.getenv("MAX_WORKERS", "5"))
@@ -50,6 +166,19 @@ class UniversalScraper(BaseScraper):
             self.max_pages = expected_pages
             logger.info(f"Setting max_pages to {expected_pages} based on expected_pages parameter")
         
+        # Pool connections for all workers and let urllib3 retry with backoff;
+        # retry_count is the number of attempts, so retries are one fewer
+        retries = Retry(
+            total=max(self.retry_count - 1, 0),
+            backoff_factor=self.delay,
+            backoff_max=RETRY_BACKOFF_MAX,
+            backoff_jitter=self.delay,
+            status_forcelist=RETRY_STATUS_CODES,
+        )
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers * 2, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Progress callback for real-time updates
         self.progress_callback = progress_callback
         
@@ -60,17 +189,37 @@ class UniversalScraper(BaseScraper):
         self.scroll_pages = os.getenv("SCROLL_PAGES", "true").lower() == "true"
         self.screenshot_pages = os.getenv("SCREENSHOT_PAGES", "false").lower() == "true"
         
-        # Queue management
-        self._url_queue = queue.Queue()
-        self._lock = threading.Lock()
-        self._visited = set()
+        # Queue management; the queue is created on the crawl's event loop
+        self._url_queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Per-host time (time.monotonic) before which no new request may start. Starts
+        # are staggered delay / max_workers apart, so the workers together send about
+        # max_workers requests per REQUEST_DELAY to a host, as when each paused after its page
+        self._host_next_ok: Dict[str, float] = {}
+        self._host_interval = self.delay / max(self.max_workers, 1)
+        # Seen URLs and page hashes only need membership tests, so Bloom filters
+        # keep them small regardless of how many URLs a crawl discovers
+        seen_capacity = max(self.max_pages * SEEN_BLOOM_ITEMS_PER_PAGE, 1024)
+        self._visited = Bloom(seen_capacity, SEEN_BLOOM_FALSE_POSITIVE_RATE)
         self._data = []
+        self._content_hashes = Bloom(seen_capacity, SEEN_BLOOM_FALSE_POSITIVE_RATE)
+        self._raw_hashes = Bloom(seen_capacity, SEEN_BLOOM_FALSE_POSITIVE_RATE)
         self._failed_urls = set()
-        self._processing = set()
         
-        # Browser instances (thread-safe)
+        # Number of URLs currently being fetched or parsed
+        self._inflight = 0
+        
+        # Browser instances; Playwright workers share one browser with a context each
         self._selenium_drivers = {}
-        self._playwright_browsers = {}
+        self._selenium_page_counts: Dict[int, int] = {}
+        self._playwright_contexts: Dict[int, BrowserContext] = {}
+        
+        # Long-lived event loop for Playwright calls made outside a crawl
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
         
         # Stats
         self.stats = {
@@ -97,10 +246,17 @@ class UniversalScraper(BaseScraper):
                 options.add_argument('--disable-web-security')
                 options.add_argument('--disable-features=VizDisplayCompositor')
                 options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+                options.add_argument('--disable-extensions')
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+                
+                # Return once the DOM is ready instead of waiting for every subresource
+                options.page_load_strategy = 'eager'
                 
                 driver = webdriver.Chrome(options=options)
                 driver.set_page_load_timeout(self.timeout)
                 self._selenium_drivers[worker_id] = driver
+                self._selenium_page_counts[worker_id] = 0
                 logger.debug(f"Created Selenium driver for worker {worker_id}")
             except Exception as e:
                 logger.error(f"Failed to create Selenium driver for worker {worker_id}: {e}")
@@ -108,27 +264,25 @@ class UniversalScraper(BaseScraper):
         
         return self._selenium_drivers[worker_id]
     
-    async def _get_playwright_browser(self, worker_id: int) -> Optional[Browser]:
-        """Get or create Playwright browser for worker"""
-        if worker_id not in self._playwright_browsers:
-            try:
-                playwright = await async_playwright().start()
-                browser = await playwright.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--disable-web-security'
-                    ]
+    async def _get_playwright_context(self, worker_id: int) -> Optional[BrowserContext]:
+        """Get or create a Playwright browser context for worker"""
+        try:
+            browser = await self._ensure_browser()
+            context = self._playwright_contexts.get(worker_id)
+            # Contexts from a browser that was relaunched can't be reused
+            if context is None or context.browser is not browser:
+                context = await browser.new_context(
+                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 )
-                self._playwright_browsers[worker_id] = browser
-                logger.debug(f"Created Playwright browser for worker {worker_id}")
-            except Exception as e:
-                logger.error(f"Failed to create Playwright browser for worker {worker_id}: {e}")
-                return None
-        
-        return self._playwright_browsers[worker_id]
+                # Skip images, fonts and media; screenshots need the full page
+                if not self.screenshot_pages:
+                    await context.route("**/*", self._block_resources)
+                self._playwright_contexts[worker_id] = context
+                logger.debug(f"Created Playwright context for worker {worker_id}")
+            return context
+        except Exception as e:
+            logger.error(f"Failed to create Playwright context for worker {worker_id}: {e}")
+            return None
     
     def get_page_content_advanced(self, url: str, worker_id: int = 0) -> Optional[str]:
         """Get page content using multiple methods with fallback"""
@@ -148,36 +302,134 @@ class UniversalScraper(BaseScraper):
         
         # Method 3: Try Playwright if enabled
         if self.use_playwright:
-            content = asyncio.run(self.get_page_content_playwright(url, worker_id))
+            content = self._submit_coro(self.get_page_content_playwright(url, worker_id))
             if content:
                 self.stats['playwright_pages'] += 1
                 return content
         
         return None
     
+    def _submit_coro(self, coro):
+        """Run a coroutine on the scraper's background event loop and wait for the result"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever, name="scraper-loop", daemon=True)
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
     def get_page_content_requests(self, url: str) -> Optional[str]:
         """Get page content using requests (fastest method)"""
+        # Retries and backoff are handled by the session's adapter
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.Timeout:
+            logger.warning(f"Timeout fetching {url} with requests")
+        except requests.exceptions.ConnectionError:
+            logger.warning(f"Connection error fetching {url} with requests")
+        except Exception as e:
+            logger.error(f"Error fetching {url} with requests: {e}")
+        
+        return None
+    
+    async def _fetch_page_content(self, session: aiohttp.ClientSession, url: str, worker_id: int) -> Optional[Union[str, bytes]]:
+        """Get page content inside the crawl loop, with the same fallbacks as get_page_content_advanced"""
+        # Method 1: Try aiohttp first (fastest)
+        content = await self.get_page_content_aiohttp(session, url)
+        if content:
+            self.stats['requests_pages'] += 1
+            return content
+        
+        # Method 2: Try Selenium if enabled; the driver blocks, so run it on the pool
+        if self.use_selenium:
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(self._executor, self.get_page_content_selenium, url, worker_id)
+            if content:
+                self.stats['selenium_pages'] += 1
+                return content
+        
+        # Method 3: Try Playwright if enabled
+        if self.use_playwright:
+            content = await self.get_page_content_playwright(url, worker_id)
+            if content:
+                self.stats['playwright_pages'] += 1
+                return content
+        
+        return None
+    
+    async def get_page_content_aiohttp(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """Get the raw page body on the crawl's shared aiohttp session; lxml decodes it while parsing"""
         for attempt in range(self.retry_count):
             try:
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.text
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout fetching {url} with requests (attempt {attempt + 1})")
-                if attempt < self.retry_count - 1:
-                    time.sleep(self.delay)
-                continue
-            except requests.exceptions.ConnectionError:
-                logger.warning(f"Connection error fetching {url} with requests (attempt {attempt + 1})")
-                if attempt < self.retry_count - 1:
-                    time.sleep(self.delay)
-                continue
+                async with session.get(url) as response:
+                    if response.status not in RETRY_STATUS_CODES:
+                        response.raise_for_status()
+                        return await response.read()
+                    logger.warning(f"HTTP {response.status} fetching {url} (attempt {attempt + 1})")
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout fetching {url} (attempt {attempt + 1})")
+            except aiohttp.ClientConnectionError:
+                logger.warning(f"Connection error fetching {url} (attempt {attempt + 1})")
             except Exception as e:
-                logger.error(f"Error fetching {url} with requests: {e}")
-                break
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            
+            # Back off like the requests session's Retry policy: per URL, capped,
+            # with jitter so workers hitting the same rate limit don't retry in step
+            if attempt < self.retry_count - 1:
+                backoff = self.delay * 2 ** attempt + random.random() * self.delay
+                await asyncio.sleep(min(backoff, RETRY_BACKOFF_MAX))
         
         return None
     
+    async def fetch_pages(self, urls: List[str]) -> AsyncIterator[Tuple[str, Optional[Union[str, bytes]]]]:
+        """Fetch a fixed list of pages the way the crawl does, yielding (url, content) as each completes"""
+        pending = asyncio.Queue()
+        for url in urls:
+            pending.put_nowait(url)
+        fetched = asyncio.Queue()
+        
+        async def worker(session: aiohttp.ClientSession, worker_id: int) -> None:
+            while not pending.empty():
+                url = pending.get_nowait()
+                # Same per-host spacing, retries and browser fallbacks as crawled pages
+                await self._wait_for_host_slot(url)
+                try:
+                    content = await self._fetch_page_content(session, url, worker_id)
+                except Exception as e:
+                    logger.error(f"Worker {worker_id} error: {e}")
+                    content = None
+                await fetched.put((url, content))
+        
+        try:
+            async with self._create_session() as session:
+                workers = [
+                    asyncio.create_task(worker(session, worker_id))
+                    for worker_id in range(min(self.max_workers, len(urls)))
+                ]
+                try:
+                    for _ in urls:
+                        yield await fetched.get()
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            await self._close_playwright_browsers()
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session shared by a crawl's workers"""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers * 4,
+            limit_per_host=self.max_workers,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+    
     def get_page_content_selenium(self, url: str, worker_id: int) -> Optional[str]:
         """Get page content using Selenium"""
         driver = self._get_selenium_driver(worker_id)
@@ -201,7 +453,7 @@ class UniversalScraper(BaseScraper):
             
             # Take screenshot if enabled
             if self.screenshot_pages:
-                screenshot_path = self.output_dir / f"screenshot_{hashlib.md5(url.encode()).hexdigest()[:8]}.png"
+                screenshot_path = self.output_dir / f"screenshot_{blake3(url.encode()).hexdigest(length=4)}.png"
                 driver.save_screenshot(str(screenshot_path))
             
             return driver.page_source
@@ -215,38 +467,47 @@ class UniversalScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Unexpected Selenium error for {url}: {e}")
             return None
+        finally:
+            self._selenium_page_counts[worker_id] += 1
+            if self._selenium_page_counts[worker_id] >= SELENIUM_RECYCLE_PAGES:
+                self._recycle_selenium_driver(worker_id)
+    
+    def _recycle_selenium_driver(self, worker_id: int):
+        """Quit a worker's driver so the next page starts a fresh one"""
+        driver = self._selenium_drivers.pop(worker_id, None)
+        self._selenium_page_counts.pop(worker_id, None)
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            logger.debug(f"Recycled Selenium driver for worker {worker_id}")
     
     async def get_page_content_playwright(self, url: str, worker_id: int) -> Optional[str]:
         """Get page content using Playwright"""
-        browser = await self._get_playwright_browser(worker_id)
-        if not browser:
+        context = await self._get_playwright_context(worker_id)
+        if not context:
             return None
         
         page = None
         try:
-            page = await browser.new_page()
-            
-            # Set user agent
-            await page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            page = await context.new_page()
             
             # Navigate to page
-            await page.goto(url, wait_until='networkidle', timeout=self.timeout * 1000)
+            await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout * 1000)
             
-            # Wait for JavaScript to load
-            await page.wait_for_timeout(self.wait_for_js * 1000)
+            # Wait for JavaScript to load, but no longer than the network stays busy
+            await self._wait_for_network_idle(page, self.wait_for_js * 1000)
             
             # Scroll to load lazy content
             if self.scroll_pages:
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(2000)
+                height = await page.evaluate("() => { const h = document.body.scrollHeight; window.scrollTo(0, h); return h; }")
+                await self._wait_for_page_growth(page, height, 2000)
                 await page.evaluate("window.scrollTo(0, 0)")
-                await page.wait_for_timeout(1000)
             
             # Take screenshot if enabled
             if self.screenshot_pages:
-                screenshot_path = self.output_dir / f"screenshot_{hashlib.md5(url.encode()).hexdigest()[:8]}.png"
+                screenshot_path = self.output_dir / f"screenshot_{blake3(url.encode()).hexdigest(length=4)}.png"
                 await page.screenshot(path=str(screenshot_path))
             
             return await page.content()
@@ -258,148 +519,116 @@ class UniversalScraper(BaseScraper):
             if page:
                 await page.close()
     
-    def extract_links_advanced(self, soup: BeautifulSoup, current_url: str) -> List[str]:
+    async def _wait_for_network_idle(self, page, timeout_ms: int):
+        """Wait until the page's network is idle, giving up quietly after timeout_ms"""
+        try:
+            await page.wait_for_load_state('networkidle', timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            pass
+    
+    async def _wait_for_page_growth(self, page, height: int, timeout_ms: int):
+        """Wait until the page grows past height (lazy content arrived), giving up quietly after timeout_ms"""
+        # The networkidle load state stays reached once hit, so it can't tell when a scroll's requests finish
+        try:
+            await page.wait_for_function("h => document.body.scrollHeight > h", arg=height, timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            pass
+    
+    def extract_links_advanced(self, soup: BeautifulSoup, current_url: str, tags: Optional[Dict[str, List[Tag]]] = None) -> List[str]:
         """Extract all valid links with advanced filtering"""
+        if tags is None:
+            tags = self._index_tags(soup)
         links = []
         
         # Extract all links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for link in tags.get('a', ()):
+            href = link.get('href')
+            if href is None:
+                continue
             absolute_url = urljoin(current_url, href)
             
             # Only include links from the same domain
-            if urlparse(absolute_url).netloc == urlparse(self.base_url).netloc:
+            if urlsplit(absolute_url).netloc == self._base_netloc:
                 # Filter out common non-content URLs
                 if not self._is_non_content_url(absolute_url):
                     links.append(absolute_url)
         
         # Also extract links from JavaScript (basic pattern matching)
-        script_content = soup.find_all('script')
-        for script in script_content:
+        for script in tags.get('script', ()):
             if script.string:
                 js_links = self._extract_links_from_js(script.string, current_url)
                 links.extend(js_links)
         
         # Also check for links in href attributes of other elements
-        for element in soup.find_all(['link', 'img', 'script', 'iframe']):
-            if element.get('href'):
+        for name in ('link', 'img', 'script', 'iframe'):
+            for element in tags.get(name, ()):
+                if not element.get('href'):
+                    continue
                 href = element['href']
                 absolute_url = urljoin(current_url, href)
-                if urlparse(absolute_url).netloc == urlparse(self.base_url).netloc:
+                if urlsplit(absolute_url).netloc == self._base_netloc:
                     if not self._is_non_content_url(absolute_url):
                         links.append(absolute_url)
         
         # Also check for data attributes that might contain URLs
-        for element in soup.find_all(attrs={'data-url': True}):
+        for element in tags.get(DATA_URL_KEY, ()):
             href = element['data-url']
             absolute_url = urljoin(current_url, href)
-            if urlparse(absolute_url).netloc == urlparse(self.base_url).netloc:
+            if urlsplit(absolute_url).netloc == self._base_netloc:
                 if not self._is_non_content_url(absolute_url):
                     links.append(absolute_url)
         
         logger.info(f"Found {len(links)} links on {current_url}")
-        return list(set(links))  # Remove duplicates
+        return self._dedupe_urls(links)  # Remove duplicates
     
-    def _is_non_content_url(self, url: str) -> bool:
-        """Check if URL is likely non-content"""
-        non_content_patterns = [
-            '/admin', '/login', '/logout', '/register', '/signup',
-            '/api/', '/ajax/', '/json/', '/xml/', '/rss',
-            '/sitemap', '/robots.txt', '/favicon.ico',
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx',
-            '.zip', '.rar', '.tar', '.gz',
-            'mailto:', 'tel:', 'javascript:'
-        ]
+    def _dedupe_urls(self, urls: List[str]) -> List[str]:
+        """Drop URLs that are variants of an earlier one, keeping the first spelling seen"""
+        unique = {}
+        for url in urls:
+            unique.setdefault(self._canonicalize(url), url)
+        return list(unique.values())
+    
+    def _canonicalize(self, url: str) -> str:
+        """Normalize a URL into the key variants of the same page dedupe on"""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
         
-        url_lower = url.lower()
+        default_port = DEFAULT_PORTS.get(scheme)
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc[:-len(default_port)]
         
+        path = parts.path.rstrip('/') or '/'
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        
+        # Fragments never change the page served, so they are dropped
+        return urlunsplit((scheme, netloc, path, query, ''))
+    
+    def _is_non_content_url(self, url: str) -> bool:
+        """Check if URL is likely non-content"""
         # Be less aggressive - only filter out obvious non-content URLs
-        for pattern in non_content_patterns:
-            if pattern in url_lower:
-                logger.debug(f"Filtering out non-content URL: {url}")
-                return True
+        if NON_CONTENT_URL_RE.search(url.lower()):
+            logger.debug(f"Filtering out non-content URL: {url}")
+            return True
         
         return False
     
     def _extract_links_from_js(self, js_content: str, base_url: str) -> List[str]:
         """Extract URLs from JavaScript content"""
-        import re
-        
-        # Common patterns for URLs in JavaScript
-        url_patterns = [
-            r'["\']([^"\']*\.html?[^"\']*)["\']',
-            r'["\']([^"\']*\.php[^"\']*)["\']',
-            r'["\']([^"\']*\.aspx[^"\']*)["\']',
-            r'["\']([^"\']*\.jsp[^"\']*)["\']',
-            r'["\']([^"\']*\.asp[^"\']*)["\']',
-            r'["\']([^"\']*\.cgi[^"\']*)["\']',
-            r'["\']([^"\']*\.pl[^"\']*)["\']',
-            r'["\']([^"\']*\.py[^"\']*)["\']',
-            r'["\']([^"\']*\.rb[^"\']*)["\']',
-            r'["\']([^"\']*\.cs[^"\']*)["\']',
-            r'["\']([^"\']*\.java[^"\']*)["\']',
-            r'["\']([^"\']*\.go[^"\']*)["\']',
-            r'["\']([^"\']*\.rs[^"\']*)["\']',
-            r'["\']([^"\']*\.swift[^"\']*)["\']',
-            r'["\']([^"\']*\.kt[^"\']*)["\']',
-            r'["\']([^"\']*\.scala[^"\']*)["\']',
-            r'["\']([^"\']*\.clj[^"\']*)["\']',
-            r'["\']([^"\']*\.hs[^"\']*)["\']',
-            r'["\']([^"\']*\.ml[^"\']*)["\']',
-            r'["\']([^"\']*\.fs[^"\']*)["\']',
-            r'["\']([^"\']*\.v[^"\']*)["\']',
-            r'["\']([^"\']*\.vhd[^"\']*)["\']',
-            r'["\']([^"\']*\.sv[^"\']*)["\']',
-            r'["\']([^"\']*\.vbs[^"\']*)["\']',
-            r'["\']([^"\']*\.ps1[^"\']*)["\']',
-            r'["\']([^"\']*\.sh[^"\']*)["\']',
-            r'["\']([^"\']*\.bat[^"\']*)["\']',
-            r'["\']([^"\']*\.cmd[^"\']*)["\']',
-            r'["\']([^"\']*\.exe[^"\']*)["\']',
-            r'["\']([^"\']*\.dll[^"\']*)["\']',
-            r'["\']([^"\']*\.so[^"\']*)["\']',
-            r'["\']([^"\']*\.dylib[^"\']*)["\']',
-            r'["\']([^"\']*\.a[^"\']*)["\']',
-            r'["\']([^"\']*\.lib[^"\']*)["\']',
-            r'["\']([^"\']*\.o[^"\']*)["\']',
-            r'["\']([^"\']*\.obj[^"\']*)["\']',
-            r'["\']([^"\']*\.class[^"\']*)["\']',
-            r'["\']([^"\']*\.jar[^"\']*)["\']',
-            r'["\']([^"\']*\.war[^"\']*)["\']',
-            r'["\']([^"\']*\.ear[^"\']*)["\']',
-            r'["\']([^"\']*\.apk[^"\']*)["\']',
-            r'["\']([^"\']*\.ipa[^"\']*)["\']',
-            r'["\']([^"\']*\.deb[^"\']*)["\']',
-            r'["\']([^"\']*\.rpm[^"\']*)["\']',
-            r'["\']([^"\']*\.msi[^"\']*)["\']',
-            r'["\']([^"\']*\.pkg[^"\']*)["\']',
-            r'["\']([^"\']*\.dmg[^"\']*)["\']',
-            r'["\']([^"\']*\.iso[^"\']*)["\']',
-            r'["\']([^"\']*\.img[^"\']*)["\']',
-            r'["\']([^"\']*\.vmdk[^"\']*)["\']',
-            r'["\']([^"\']*\.vdi[^"\']*)["\']',
-            r'["\']([^"\']*\.vhd[^"\']*)["\']',
-            r'["\']([^"\']*\.vhdx[^"\']*)["\']',
-            r'["\']([^"\']*\.ova[^"\']*)["\']',
-            r'["\']([^"\']*\.ovf[^"\']*)["\']',
-            r'["\"]/([^"\"]*)["\"]',  # General path pattern
-        ]
-        
         links = []
-        for pattern in url_patterns:
-            matches = re.findall(pattern, js_content)
-            for match in matches:
+        for pattern in (JS_FILE_URL_RE, JS_PATH_URL_RE):
+            for match in pattern.findall(js_content):
                 if match.startswith('/'):
                     # Relative URL
                     absolute_url = urljoin(base_url, match)
-                    if urlparse(absolute_url).netloc == urlparse(self.base_url).netloc:
+                    if urlsplit(absolute_url).netloc == self._base_netloc:
                         links.append(absolute_url)
                 elif match.startswith('http'):
                     # Absolute URL
-                    if urlparse(match).netloc == urlparse(self.base_url).netloc:
+                    if urlsplit(match).netloc == self._base_netloc:
                         links.append(match)
         
-        return list(set(links))
+        return self._dedupe_urls(links)
     
     def extract_page_data_advanced(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Extract comprehensive data from a page"""
@@ -425,24 +654,36 @@ class UniversalScraper(BaseScraper):
         main_content = self._extract_main_content_advanced(soup)
         data['content'] = main_content
         
+        # Walk the remaining tree once; every extractor below reads this index
+        tags = self._index_tags(soup)
+        
         # Extract links
-        data['links'] = self.extract_links_advanced(soup, url)
+        data['links'] = self.extract_links_advanced(soup, url, tags)
         
         # Extract metadata
-        data['metadata'] = self._extract_metadata_advanced(soup)
+        data['metadata'] = self._extract_metadata_advanced(soup, tags)
         
         # Extract images
-        data['images'] = self._extract_images(soup, url)
+        data['images'] = self._extract_images(soup, url, tags)
         
         # Extract forms
-        data['forms'] = self._extract_forms(soup, url)
+        data['forms'] = self._extract_forms(soup, url, tags)
         
         # Extract scripts and styles
-        data['scripts'] = self._extract_scripts(soup, url)
-        data['styles'] = self._extract_styles(soup, url)
+        data['scripts'] = self._extract_scripts(soup, url, tags)
+        data['styles'] = self._extract_styles(soup, url, tags)
         
         return data
     
+    def _index_tags(self, soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+        """Group the tree's tags by name in one walk, in document order"""
+        tags = defaultdict(list)
+        for tag in soup.find_all(True):
+            tags[tag.name].append(tag)
+            if 'data-url' in tag.attrs:
+                tags[DATA_URL_KEY].append(tag)
+        return tags
+    
     def _extract_main_content_advanced(self, soup: BeautifulSoup) -> str:
         """Extract main content with advanced cleaning"""
         # Remove unwanted elements
@@ -450,18 +691,10 @@ class UniversalScraper(BaseScraper):
             element.decompose()
         
         # Try to find main content areas with priority
-        main_selectors = [
-            'main', 'article', '.content', '.main-content', '.post-content', '.entry-content',
-            '#content', '#main', '.post', '.article', '[role="main"]', '.container',
-            '.wrapper', '.page-content', '.site-content', '.primary-content'
-        ]
-        
         content = ""
-        for selector in main_selectors:
-            element = soup.select_one(selector)
-            if element:
-                content = element.get_text(separator=' ', strip=True)
-                break
+        element = self._find_main_element(soup)
+        if element:
+            content = element.get_text(separator=' ', strip=True)
         
         # If no main content found, use body
         if not content:
@@ -473,104 +706,60 @@ class UniversalScraper(BaseScraper):
         content = self._clean_content_advanced(content)
         return content[:15000]  # Increased limit for comprehensive content
     
+    def _find_main_element(self, soup: BeautifulSoup):
+        """Return the first match of the highest-priority main content selector"""
+        best_element = None
+        best_rank = len(MAIN_CONTENT_MATCHERS)
+        for element in MAIN_CONTENT_SELECTOR.iselect(soup):
+            # Candidates arrive in document order, so only a strictly better rank replaces
+            for rank in range(best_rank):
+                if MAIN_CONTENT_MATCHERS[rank].match(element):
+                    best_element, best_rank = element, rank
+                    break
+            if best_rank == 0:
+                break
+        return best_element
+    
     def _clean_content_advanced(self, text: str) -> str:
         """Advanced content cleaning"""
-        import re
-        
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         
         # Remove common boilerplate
-        boilerplate_patterns = [
-            r'cookie policy',
-            r'privacy policy',
-            r'terms of service',
-            r'© \d{4}.*?\.',
-            r'all rights reserved',
-            r'powered by.*?\.',
-            r'loading\.\.\.',
-            r'please wait\.\.\.',
-            r'javascript required',
-            r'this site uses cookies',
-            r'accept cookies',
-            r'decline cookies',
-            r'subscribe to newsletter',
-            r'newsletter signup',
-            r'follow us on',
-            r'like us on facebook',
-            r'follow us on twitter',
-            r'follow us on instagram',
-            r'follow us on linkedin',
-            r'follow us on youtube',
-            r'follow us on tiktok',
-            r'follow us on snapchat',
-            r'follow us on pinterest',
-            r'follow us on reddit',
-            r'follow us on discord',
-            r'follow us on telegram',
-            r'follow us on whatsapp',
-            r'follow us on wechat',
-            r'follow us on weibo',
-            r'follow us on vk',
-            r'follow us on ok',
-            r'follow us on odnoklassniki',
-            r'follow us on viber',
-            r'follow us on line',
-            r'follow us on kik',
-            r'follow us on skype',
-            r'follow us on zoom',
-            r'follow us on teams',
-            r'follow us on slack',
-            r'follow us on discord',
-            r'follow us on telegram',
-            r'follow us on whatsapp',
-            r'follow us on wechat',
-            r'follow us on weibo',
-            r'follow us on vk',
-            r'follow us on ok',
-            r'follow us on odnoklassniki',
-            r'follow us on viber',
-            r'follow us on line',
-            r'follow us on kik',
-            r'follow us on skype',
-            r'follow us on zoom',
-            r'follow us on teams',
-            r'follow us on slack',
-        ]
-        
-        for pattern in boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Remove empty lines
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        text = '\n'.join(lines)
+        for pattern in BOILERPLATE_RES:
+            text = pattern.sub('', text)
         
+        # Whitespace is already collapsed, so there are no empty lines left to drop
         return text.strip()
     
-    def _extract_metadata_advanced(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_metadata_advanced(self, soup: BeautifulSoup, tags: Optional[Dict[str, List[Tag]]] = None) -> Dict[str, str]:
         """Extract comprehensive metadata"""
+        if tags is None:
+            tags = self._index_tags(soup)
         metadata = {}
+        meta_tags = tags.get('meta', ())
         
         # Meta tags
-        for meta in soup.find_all('meta'):
+        for meta in meta_tags:
             name = meta.get('name', meta.get('property', ''))
             content = meta.get('content', '')
             if name and content:
                 metadata[name] = content
         
         # Open Graph tags
-        for meta in soup.find_all('meta', property=True):
-            if meta['property'].startswith('og:'):
+        for meta in meta_tags:
+            if meta.get('property', '').startswith('og:'):
                 metadata[meta['property']] = meta.get('content', '')
         
         # Twitter Card tags
-        for meta in soup.find_all('meta', attrs={'name': True}):
-            if meta['name'].startswith('twitter:'):
+        for meta in meta_tags:
+            if meta.get('name', '').startswith('twitter:'):
                 metadata[meta['name']] = meta.get('content', '')
         
         # Schema.org structured data
-        script_tags = soup.find_all('script', type='application/ld+json')
-        for script in script_tags:
+        for script in tags.get('script', ()):
+            if script.get('type') != 'application/ld+json':
+                continue
             try:
                 data = json.loads(script.string)
                 if isinstance(data, dict):
@@ -580,11 +769,15 @@ class UniversalScraper(BaseScraper):
         
         return metadata
     
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
+    def _extract_images(self, soup: BeautifulSoup, base_url: str, tags: Optional[Dict[str, List[Tag]]] = None) -> List[Dict[str, str]]:
         """Extract image information"""
+        if tags is None:
+            tags = self._index_tags(soup)
         images = []
-        for img in soup.find_all('img', src=True):
-            src = img['src']
+        for img in tags.get('img', ()):
+            src = img.get('src')
+            if src is None:
+                continue
             absolute_url = urljoin(base_url, src)
             
             image_info = {
@@ -598,10 +791,12 @@ class UniversalScraper(BaseScraper):
         
         return images
     
-    def _extract_forms(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, Any]]:
+    def _extract_forms(self, soup: BeautifulSoup, base_url: str, tags: Optional[Dict[str, List[Tag]]] = None) -> List[Dict[str, Any]]:
         """Extract form information"""
+        if tags is None:
+            tags = self._index_tags(soup)
         forms = []
-        for form in soup.find_all('form'):
+        for form in tags.get('form', ()):
             form_info = {
                 'action': urljoin(base_url, form.get('action', '')),
                 'method': form.get('method', 'get'),
@@ -622,19 +817,28 @@ class UniversalScraper(BaseScraper):
         
         return forms
     
-    def _extract_scripts(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _extract_scripts(self, soup: BeautifulSoup, base_url: str, tags: Optional[Dict[str, List[Tag]]] = None) -> List[str]:
         """Extract script URLs"""
+        if tags is None:
+            tags = self._index_tags(soup)
         scripts = []
-        for script in soup.find_all('script', src=True):
-            src = script['src']
+        for script in tags.get('script', ()):
+            src = script.get('src')
+            if src is None:
+                continue
             absolute_url = urljoin(base_url, src)
             scripts.append(absolute_url)
         return scripts
     
-    def _extract_styles(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _extract_styles(self, soup: BeautifulSoup, base_url: str, tags: Optional[Dict[str, List[Tag]]] = None) -> List[str]:
         """Extract stylesheet URLs"""
+        if tags is None:
+            tags = self._index_tags(soup)
         styles = []
-        for link in soup.find_all('link', rel='stylesheet'):
+        for link in tags.get('link', ()):
+            # rel is multi-valued, so it parses to a list of tokens
+            if 'stylesheet' not in (link.get('rel') or ()):
+                continue
             href = link.get('href')
             if href:
                 absolute_url = urljoin(base_url, href)
@@ -643,104 +847,125 @@ class UniversalScraper(BaseScraper):
     
     def _generate_content_hash(self, content: str) -> str:
         """Generate hash for content deduplication"""
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        # 128-bit BLAKE3 digest: same width as the old MD5 hex, several times faster
+        return blake3(content.encode('utf-8')).hexdigest(length=16)
     
-    def scrape_page_worker(self, worker_id: int) -> None:
-        """Worker function for scraping pages from queue"""
+    async def scrape_page_worker(self, session: aiohttp.ClientSession, worker_id: int) -> None:
+        """Worker coroutine for scraping pages from the queue"""
         logger.info(f"Worker {worker_id} started")
         
         while True:
+            url = await self._url_queue.get()
             try:
-                # Get URL from queue with timeout
-                url = self._url_queue.get(timeout=10)
-                
-                # Check if this is a stop signal
-                if url is None:
-                    logger.info(f"Worker {worker_id} received stop signal")
-                    break
-                
-                # Check if already visited or if we've reached the page limit
-                with self._lock:
-                    if url in self._visited or url in self._processing:
-                        self._url_queue.task_done()
-                        continue
-                    
-                    # Check if we've reached the page limit
-                    if len(self._data) >= self.max_pages:
-                        logger.info(f"Worker {worker_id} reached page limit ({self.max_pages}), stopping")
-                        self._url_queue.task_done()
-                        break
-                    
-                    self._visited.add(url)
-                    self._processing.add(url)
-                
-                logger.info(f"Worker {worker_id} scraping: {url}")
-                
-                # Get page content using advanced methods
-                content = self.get_page_content_advanced(url, worker_id)
-                
-                if not content:
-                    with self._lock:
-                        self._failed_urls.add(url)
-                        self.stats['failed_pages'] += 1
-                        self._processing.remove(url)
-                    self._url_queue.task_done()
-                    continue
-                
-                # Parse content
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Extract data
-                page_data = self.extract_page_data_advanced(soup, url)
-                logger.info(f"Worker {worker_id} found {len(page_data.get('links', []))} links on {url}")
-                
-                # Check for duplicates
-                content_hash = self._generate_content_hash(page_data['content'])
-                if content_hash in [self._generate_content_hash(item['content']) for item in self._data]:
-                    with self._lock:
-                        self.stats['duplicate_pages'] += 1
-                        self._processing.remove(url)
-                    self._url_queue.task_done()
-                    continue
-                
-                # Add content hash to data
-                page_data['content_hash'] = content_hash
-                
-                with self._lock:
-                    self._data.append(page_data)
-                    self.stats['successful_pages'] += 1
-                    self._processing.remove(url)
-                
-                # Add new URLs to queue (only if we haven't reached the limit)
-                with self._lock:
-                    if len(self._data) < self.max_pages:
-                        new_urls = page_data.get('links', [])
-                        added_count = 0
-                        for new_url in new_urls:
-                            if new_url not in self._visited and new_url not in self._processing:
-                                self._url_queue.put(new_url)
-                                added_count += 1
-                        logger.info(f"Worker {worker_id} added {added_count} new URLs to queue from {url}")
-                    else:
-                        logger.info(f"Worker {worker_id} reached page limit, not adding more URLs")
-                
-                # Mark task as done
-                self._url_queue.task_done()
-                
-                # Small delay to be respectful
-                time.sleep(self.delay)
-                
-            except queue.Empty:
-                logger.info(f"Worker {worker_id} queue empty, stopping")
-                break
+                await self._scrape_url(session, url, worker_id)
             except Exception as e:
                 logger.error(f"Worker {worker_id} error: {e}")
-                try:
-                    self._url_queue.task_done()
-                except:
-                    pass
-        
-        logger.info(f"Worker {worker_id} finished")
+            finally:
+                self._url_queue.task_done()
+    
+    async def _scrape_url(self, session: aiohttp.ClientSession, url: str, worker_id: int) -> None:
+        """Fetch, parse and store a single queued URL"""
+        # All crawl state is owned by the event loop, so no locking is needed.
+        # URLs are marked visited when queued, so each one arrives here only once.
+        # Check if we've reached the page limit; remaining queue entries are drained
+        if len(self._data) >= self.max_pages:
+            return
+        
+        self._inflight += 1
+        try:
+            logger.info(f"Worker {worker_id} scraping: {url}")
+            
+            # Be respectful: requests to one host are spaced out across the workers
+            await self._wait_for_host_slot(url)
+            
+            # Get page content using advanced methods
+            content = await self._fetch_page_content(session, url, worker_id)
+            
+            if not content:
+                self._failed_urls.add(url)
+                self.stats['failed_pages'] += 1
+                return
+            
+            # Byte-identical bodies are duplicates; skip them before paying for a parse
+            raw = content if isinstance(content, bytes) else content.encode('utf-8')
+            raw_hash = blake3(raw).digest(length=16)
+            if raw_hash in self._raw_hashes:
+                self.stats['duplicate_pages'] += 1
+                return
+            self._raw_hashes.add(raw_hash)
+            
+            # Parse and extract off the event loop so other fetches keep going;
+            # parsing is CPU-bound, so it uses worker processes when available
+            loop = asyncio.get_running_loop()
+            if self._parse_pool is not None:
+                page_data = await loop.run_in_executor(self._parse_pool, _parse_page_in_worker, content, url)
+            else:
+                page_data = await loop.run_in_executor(self._executor, self._parse_page, content, url)
+            logger.info(f"Worker {worker_id} found {len(page_data.get('links', []))} links on {url}")
+            
+            # Check for duplicates; only the set operations run on the event loop
+            content_hash = page_data['content_hash']
+            if content_hash in self._content_hashes:
+                self.stats['duplicate_pages'] += 1
+                return
+            self._content_hashes.add(content_hash)
+            
+            self._data.append(page_data)
+            self.stats['successful_pages'] += 1
+        finally:
+            self._inflight -= 1
+        
+        # Add new URLs to queue (only if we haven't reached the limit)
+        if len(self._data) < self.max_pages:
+            added_count = 0
+            for new_url in page_data.get('links', []):
+                # Dedupe on the canonical form but fetch the URL as the page wrote it;
+                # servers may treat /path and /path/ as different resources
+                key = self._canonicalize(new_url)
+                if key not in self._visited:
+                    if not self._enqueue(new_url, key):
+                        break
+                    added_count += 1
+            logger.info(f"Worker {worker_id} added {added_count} new URLs to queue from {url}")
+        else:
+            logger.info(f"Worker {worker_id} reached page limit, not adding more URLs")
+    
+    def _enqueue(self, url: str, key: str) -> bool:
+        """Queue a URL and mark its canonical key visited; False if the frontier is full"""
+        try:
+            self._url_queue.put_nowait(url)
+        except asyncio.QueueFull:
+            return False
+        # Marking at enqueue time keeps a URL from sitting in the queue twice
+        self._visited.add(key)
+        return True
+    
+    async def _wait_for_host_slot(self, url: str) -> None:
+        """Reserve the next request slot for the URL's host and wait for it"""
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        slot = max(now, self._host_next_ok.get(host, 0.0))
+        self._host_next_ok[host] = slot + self._host_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def _create_process_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """Create a process pool whose workers each hold a copy of this scraper"""
+        # Forking after the thread pools, resolver threads or loop thread have started
+        # can deadlock the child, so workers come from a clean process instead
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD),
+            initializer=_init_scraper_worker,
+            initargs=(type(self), self.base_url, str(self.output_dir))
+        )
+    
+    def _parse_page(self, content: Union[str, bytes], url: str) -> Dict[str, Any]:
+        """Parse raw HTML and extract page data, including its content hash"""
+        soup = BeautifulSoup(content, 'lxml')
+        page_data = self.extract_page_data_advanced(soup, url)
+        page_data['content_hash'] = self._generate_content_hash(page_data['content'])
+        return page_data
     
     def scrape_site(self) -> List[Dict[str, Any]]:
         """Main scraping method with advanced queue management"""
@@ -752,92 +977,29 @@ class UniversalScraper(BaseScraper):
         
         # Reset state
         self._visited.clear()
-        self._processing.clear()
+        self._inflight = 0
         self._failed_urls.clear()
         self._data.clear()
-        
-        # Initialize queue with base URL
-        self._url_queue.put(self.base_url)
-        
-        # Create and start workers
-        workers = []
-        for worker_id in range(self.max_workers):
-            worker = threading.Thread(target=self.scrape_page_worker, args=(worker_id,))
-            worker.daemon = True
-            worker.start()
-            workers.append(worker)
-            logger.info(f"Started worker {worker_id}")
-        
-        # Monitor progress with better logic
-        last_report_time = time.time()
-        while True:
-            current_time = time.time()
-            queue_size = self._url_queue.qsize()
-            data_size = len(self._data)
-            
-            # Calculate progress percentage
-            progress = min(100.0, (data_size / self.max_pages) * 100) if self.max_pages > 0 else 0.0
-            
-            # Report progress every 2 seconds and call progress callback
-            if current_time - last_report_time >= 2:
-                logger.info(f"Progress: {data_size} pages scraped, {queue_size} URLs in queue, {len(self._processing)} processing")
-                last_report_time = current_time
-                
-                        # Call progress callback if provided
-                if self.progress_callback:
-                    try:
-                        # Calculate current page being processed
-                        current_page_info = "Initializing..."
-                        if data_size > 0:
-                            current_page_info = f"Processing page {data_size + 1}"
-                        elif queue_size > 0:
-                            current_page_info = "Discovering pages..."
-                        elif len(self._processing) > 0:
-                            current_page_info = "Processing current page..."
-                        
-                        # Create progress message
-                        if data_size >= self.max_pages:
-                            progress_message = f"Reached page limit ({self.max_pages} pages)"
-                        elif data_size == 0 and queue_size == 0 and len(self._processing) == 0:
-                            progress_message = "No pages found or connection issues"
-                        else:
-                            progress_message = f"Scraped {data_size} pages, {queue_size} in queue, {len(self._processing)} processing"
-                        
-                        self.progress_callback({
-                            'progress': progress,
-                            'pages_scraped': data_size,
-                            'total_pages': self.max_pages,
-                            'current_page': current_page_info,
-                            'message': progress_message
-                        })
-                    except Exception as e:
-                        logger.error(f"Error in progress callback: {e}")
-            
-            # Check if we should stop
-            if data_size >= self.max_pages:
-                logger.info(f"Reached max pages limit ({self.max_pages})")
-                break
-            
-            # Check if queue is empty and no workers are processing
-            if queue_size == 0 and len(self._processing) == 0:
-                # Wait a bit more to see if any workers are still discovering URLs
-                time.sleep(3)
-                queue_size = self._url_queue.qsize()
-                if queue_size == 0 and len(self._processing) == 0:
-                    logger.info("Queue empty and no workers processing after wait, stopping")
-                    break
-            
-            time.sleep(1)
-        
-        # Stop all workers
-        logger.info("Stopping all workers...")
-        for _ in range(self.max_workers):
-            self._url_queue.put(None)  # Signal to stop
-        
-        # Wait for workers to finish
-        for i, worker in enumerate(workers):
-            worker.join(timeout=30)
-            logger.info(f"Worker {i} joined")
+        self._content_hashes.clear()
+        self._raw_hashes.clear()
+        self._host_next_ok.clear()
+        
+        # Parsing holds the GIL, so larger crawls parse in worker processes.
+        # Daemonic processes (e.g. Celery prefork workers) cannot start children.
+        # At most max_workers pages are parsed at once, so more processes would sit idle.
+        if self.max_pages >= PARSE_POOL_MIN_PAGES and not multiprocessing.current_process().daemon:
+            self._parse_pool = self._create_process_pool(min(os.cpu_count() or 1, self.max_workers))
+        
+        # Selenium (and parsing without a process pool) is blocking, so it runs on a thread pool
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            self._executor = executor
+            try:
+                asyncio.run(self._crawl())
+            finally:
+                self._executor = None
+                if self._parse_pool is not None:
+                    self._parse_pool.shutdown()
+                    self._parse_pool = None
         
         # Cleanup browser instances
         self._cleanup_browsers()
@@ -850,34 +1012,148 @@ class UniversalScraper(BaseScraper):
         
         return self._data
     
+    async def _crawl(self) -> None:
+        """Run the worker coroutines until the queue is drained"""
+        # Bounded frontier; only max_pages pages are ever scraped, so URLs
+        # discovered beyond a few per page are dropped rather than stored
+        self._url_queue = asyncio.Queue(maxsize=max(self.max_pages * 4, 1024))
+        
+        # Initialize queue with base URL
+        self._enqueue(self.base_url, self._canonicalize(self.base_url))
+        
+        try:
+            async with self._create_session() as session:
+                # Create and start workers
+                workers = [
+                    asyncio.create_task(self.scrape_page_worker(session, worker_id))
+                    for worker_id in range(self.max_workers)
+                ]
+                logger.info(f"Started {len(workers)} workers")
+                monitor = asyncio.create_task(self._report_progress())
+                
+                # Workers stop enqueueing at the page limit, so the queue always drains
+                await self._url_queue.join()
+                
+                # Stop all workers
+                logger.info("Stopping all workers...")
+                monitor.cancel()
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(monitor, *workers, return_exceptions=True)
+        finally:
+            # Playwright browsers belong to this event loop, so close them here,
+            # even when the crawl fails or is cancelled
+            await self._close_playwright_browsers()
+    
+    async def _report_progress(self) -> None:
+        """Log progress and call the progress callback every 2 seconds"""
+        while True:
+            await asyncio.sleep(2)
+            
+            queue_size = self._url_queue.qsize()
+            data_size = len(self._data)
+            processing = self._inflight
+            
+            # Calculate progress percentage
+            progress = min(100.0, (data_size / self.max_pages) * 100) if self.max_pages > 0 else 0.0
+            
+            logger.info(f"Progress: {data_size} pages scraped, {queue_size} URLs in queue, {processing} processing")
+            
+            # Call progress callback if provided
+            if self.progress_callback:
+                try:
+                    # Calculate current page being processed
+                    current_page_info = "Initializing..."
+                    if data_size > 0:
+                        current_page_info = f"Processing page {data_size + 1}"
+                    elif queue_size > 0:
+                        current_page_info = "Discovering pages..."
+                    elif processing > 0:
+                        current_page_info = "Processing current page..."
+                    
+                    # Create progress message
+                    if data_size >= self.max_pages:
+                        progress_message = f"Reached page limit ({self.max_pages} pages)"
+                    elif data_size == 0 and queue_size == 0 and processing == 0:
+                        progress_message = "No pages found or connection issues"
+                    else:
+                        progress_message = f"Scraped {data_size} pages, {queue_size} in queue, {processing} processing"
+                    
+                    self.progress_callback({
+                        'progress': progress,
+                        'pages_scraped': data_size,
+                        'total_pages': self.max_pages,
+                        'current_page': current_page_info,
+                        'message': progress_message
+                    })
+                except Exception as e:
+                    logger.error(f"Error in progress callback: {e}")
+    
+    async def _close_playwright_browsers(self):
+        """Close Playwright contexts and the shared browser on the running event loop"""
+        # Handles made on another loop (the background _submit_coro loop) can only be
+        # closed there; _cleanup_browsers does that
+        if self._browser_loop is not asyncio.get_running_loop():
+            return
+        
+        # Contexts close independently, so their round trips to the browser overlap
+        worker_ids = list(self._playwright_contexts)
+        results = await asyncio.gather(
+            *(context.close() for context in self._playwright_contexts.values()),
+            return_exceptions=True
+        )
+        for worker_id, result in zip(worker_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing Playwright context for worker {worker_id}: {result}")
+        self._playwright_contexts.clear()
+        
+        try:
+            await self.shutdown()
+        except Exception as e:
+            logger.warning(f"Error closing Playwright browser: {e}")
+    
+    def _quit_driver(self, driver: webdriver.Chrome):
+        """Quit a Selenium driver, ignoring drivers that are already gone"""
+        try:
+            driver.quit()
+        except:
+            pass
+    
     def _cleanup_browsers(self):
         """Cleanup browser instances"""
-        # Cleanup Selenium drivers
-        for worker_id, driver in self._selenium_drivers.items():
+        # Cleanup Selenium drivers; quit() blocks until Chrome exits, so quit them all at once
+        drivers = list(self._selenium_drivers.values())
+        if drivers:
             try:
-                driver.quit()
-            except:
-                pass
+                with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                    executor.map(self._quit_driver, drivers)
+            except RuntimeError:
+                # No new threads during interpreter shutdown (e.g. from __del__)
+                for driver in drivers:
+                    self._quit_driver(driver)
         self._selenium_drivers.clear()
+        self._selenium_page_counts.clear()
         
-        # Cleanup Playwright browsers
-        for worker_id, browser in self._playwright_browsers.items():
-            try:
-                # Create a new event loop for cleanup if needed
+        # Cleanup Playwright; its objects can only be closed on the loop that made them
+        if self._loop is not None:
+            if self._browser is not None and self._browser_loop is self._loop:
                 try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If loop is running, schedule the cleanup
-                        loop.create_task(browser.close())
-                    else:
-                        # If loop is not running, run it
-                        asyncio.run(browser.close())
-                except RuntimeError:
-                    # If no event loop exists, create one
-                    asyncio.run(browser.close())
-            except Exception as e:
-                logger.warning(f"Error closing Playwright browser for worker {worker_id}: {e}")
-        self._playwright_browsers.clear()
+                    asyncio.run_coroutine_threadsafe(self._close_playwright_browsers(), self._loop).result(timeout=30)
+                except Exception as e:
+                    logger.warning(f"Error closing Playwright browser: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+            if not self._loop_thread.is_alive():
+                self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+        
+        # Anything left belongs to a crawl loop that has already finished
+        self._playwright_contexts.clear()
+        self._context = None
+        self._browser = None
+        self._playwright = None
+        self._browser_loop = None
     
     def parse_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """Parse a single page and extract data"""
@@ -891,58 +1167,76 @@ class UniversalScraper(BaseScraper):
         """Optimize and process scraped data for RAG usage"""
         logger.info("Optimizing data for RAG...")
         
-        optimized_data = []
-        
-        for page in data:
-            # Create optimized page data
-            optimized_page = {
-                'url': page.get('url', ''),
-                'title': page.get('title', ''),
-                'content': page.get('content', ''),
-                'metadata': page.get('metadata', {}),
-                'site_domain': urlparse(page.get('url', '')).netloc,
-                'page_type': self._identify_page_type(page),
-                'content_summary': self._generate_content_summary(page.get('content', '')),
-                'key_topics': self._extract_key_topics(page.get('content', '')),
-                'timestamp': page.get('timestamp', time.time()),
-                'content_hash': page.get('content_hash', ''),
-                'word_count': len(page.get('content', '').split()),
-                'images_count': len(page.get('images', [])),
-                'forms_count': len(page.get('forms', [])),
-                'links_count': len(page.get('links', []))
-            }
-            
-            # Add structured data if available
-            if 'metadata' in page and 'schema_org' in page['metadata']:
-                optimized_page['structured_data'] = page['metadata']['schema_org']
-            
-            optimized_data.append(optimized_page)
+        # Pages are independent, so large crawls are spread across processes.
+        # Daemonic processes (e.g. Celery prefork workers) cannot start children.
+        cpu_count = os.cpu_count() or 1
+        if len(data) < OPTIMIZE_POOL_MIN_PAGES or cpu_count == 1 or multiprocessing.current_process().daemon:
+            optimized_data = [self._optimize_page(page) for page in data]
+        else:
+            chunksize = max(1, len(data) // (cpu_count * 4))
+            with self._create_process_pool(cpu_count) as executor:
+                optimized_data = list(executor.map(_optimize_page_in_worker, data, chunksize=chunksize))
         
         logger.info(f"Optimized {len(optimized_data)} pages for RAG")
         return optimized_data
     
-    def _identify_page_type(self, page: Dict[str, Any]) -> str:
+    def _optimize_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the RAG-ready record for one scraped page"""
+        url = page.get('url', '')
+        content = page.get('content', '')
+        metadata = page.get('metadata', {})
+        
+        # Lowercase and split the content once; lowercasing never adds or
+        # removes whitespace, so the lowercase words also give the word count
+        content_lower = content.lower()
+        words = content_lower.split()
+        
+        # Create optimized page data
+        optimized_page = {
+            'url': url,
+            'title': page.get('title', ''),
+            'content': content,
+            'metadata': metadata,
+            'site_domain': urlsplit(url).netloc,
+            'page_type': self._identify_page_type(page, content_lower),
+            'content_summary': self._generate_content_summary(content),
+            'key_topics': self._extract_key_topics(content, words),
+            'timestamp': page.get('timestamp', time.time()),
+            'content_hash': page.get('content_hash', ''),
+            'word_count': len(words),
+            'images_count': len(page.get('images', [])),
+            'forms_count': len(page.get('forms', [])),
+            'links_count': len(page.get('links', []))
+        }
+        
+        # Add structured data if available
+        if 'metadata' in page and 'schema_org' in metadata:
+            optimized_page['structured_data'] = metadata['schema_org']
+        
+        return optimized_page
+    
+    def _identify_page_type(self, page: Dict[str, Any], content_lower: Optional[str] = None) -> str:
         """Identify the type of page based on content and URL"""
         url = page.get('url', '').lower()
-        content = page.get('content', '').lower()
-        title = page.get('title', '').lower()
         
-        # Product page indicators
-        if any(word in url for word in ['product', 'item', 'goods', 'buy', 'shop']):
+        # Product page indicators; content is only lowercased if the URL misses
+        if any(word in url for word in PRODUCT_URL_KEYWORDS):
             return 'product'
-        if any(word in content for word in ['price', 'add to cart', 'buy now', 'product']):
+        if content_lower is None:
+            content_lower = page.get('content', '').lower()
+        if any(word in content_lower for word in PRODUCT_CONTENT_KEYWORDS):
             return 'product'
         
         # Category page indicators
-        if any(word in url for word in ['category', 'catalog', 'collection']):
+        if any(word in url for word in CATEGORY_URL_KEYWORDS):
             return 'category'
         
         # Contact page indicators
-        if any(word in url for word in ['contact', 'about', 'company']):
+        if any(word in url for word in CONTACT_URL_KEYWORDS):
             return 'contact'
         
         # Blog/Article indicators
-        if any(word in url for word in ['blog', 'article', 'news', 'post']):
+        if any(word in url for word in ARTICLE_URL_KEYWORDS):
             return 'article'
         
         # Home page
@@ -963,25 +1257,19 @@ class UniversalScraper(BaseScraper):
         
         return summary
     
-    def _extract_key_topics(self, content: str) -> List[str]:
-        """Extract key topics from content"""
+    def _extract_key_topics(self, content: str, words: Optional[List[str]] = None) -> List[str]:
+        """Extract key topics from content, or from its already-split lowercase words"""
         if not content:
             return []
         
-        # Simple keyword extraction (can be enhanced with NLP)
-        words = content.lower().split()
-        word_freq = {}
-        
-        # Filter out common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'}
+        if words is None:
+            words = content.lower().split()
         
-        for word in words:
-            if len(word) > 3 and word not in stop_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        # Simple keyword extraction (can be enhanced with NLP), ignoring common words
+        word_freq = Counter(word for word in words if len(word) > 3 and word not in STOP_WORDS)
         
-        # Get top 5 most frequent words
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_words[:5]]
+        # Get top 5 most frequent words; ties keep first-seen order as before
+        return [word for word, freq in word_freq.most_common(5)]
     
     def scrape_and_save(self, output_format: str = "json") -> Dict[str, str]:
         """Scrape site and save data"""
@@ -991,7 +1279,7 @@ class UniversalScraper(BaseScraper):
         optimized_data = self.optimize_data_for_rag(data)
         
         # Generate filename
-        domain = urlparse(self.base_url).netloc.replace('.', '_')
+        domain = self._base_netloc.replace('.', '_')
         filename = f"scraped_{domain}_{int(time.time())}"
         
         saved_files = {}
@@ -1015,7 +1303,7 @@ class UniversalScraper(BaseScraper):
         
         # Generate filename
         if not filename:
-            domain = urlparse(self.base_url).netloc.replace('.', '_')
+            domain = self._base_netloc.replace('.', '_')
             filename = f"scraped_{domain}_{int(time.time())}"
         
         filepath = self.output_dir / f"{filename}.json"
@@ -1027,12 +1315,31 @@ class UniversalScraper(BaseScraper):
             'pages': optimized_data
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
+        filepath.write_bytes(orjson.dumps(save_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"Data saved to {filepath}")
         return str(filepath)
     
     def __del__(self):
         """Cleanup on destruction"""
-        self._cleanup_browsers() 
\ No newline at end of file
+        self._cleanup_browsers()
+
+
+# Per-process scraper used by ProcessPoolExecutor workers
+_worker_scraper = None
+
+
+def _init_scraper_worker(scraper_class: type, base_url: str, output_dir: str):
+    """Create the scraper instance for a worker process"""
+    global _worker_scraper
+    _worker_scraper = scraper_class(base_url, output_dir)
+
+
+def _parse_page_in_worker(content: Union[str, bytes], url: str) -> Dict[str, Any]:
+    """Parse a single page inside a worker process"""
+    return _worker_scraper._parse_page(content, url)
+
+
+def _optimize_page_in_worker(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Optimize a single page for RAG inside a worker process"""
+    return _worker_scraper._optimize_page(page)
@@ -5,9 +5,11 @@ Production-grade background tasks for web scraping and RAG processing
 """
 
 import os
+import re
 import sys
 import json
 import time
+import asyncio
 import hashlib
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -25,6 +27,10 @@ from src.scraper.universal_scraper import UniversalScraper
 from src.rag.vector_store import VectorStore
 from src.rag.llm_interface import OpenAIInterface, BedrockInterface, RAGSystem
 
+# Contact patterns, compiled once for every page
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_RE = re.compile(r'[\+]?[1-9]?[0-9]{7,15}')
+
 # Global variables for caching
 _vector_store = None
 _rag_system = None
@@ -258,41 +264,47 @@ def scrape_business_task(self, url: str, pages_to_scrape: Optional[List[str]] =
             else:
                 business_urls.append(urljoin(url, page))
         
-        # Scrape each business page
-        scraped_data = []
+        # Scrape business pages concurrently, with the crawl's per-host spacing,
+        # retries and browser fallbacks; each page is parsed as soon as it arrives
+        scraped_pages = {}
         failed_urls = []
         
-        for i, business_url in enumerate(business_urls):
-            try:
-                update_progress({
-                    'progress': (i / len(business_urls)) * 90,  # Reserve 10% for final processing
-                    'pages_scraped': i,
-                    'total_pages': len(business_urls),
-                    'current_page': business_url,
-                    'message': f'Scraping business page {i+1} of {len(business_urls)}'
-                })
-                
-                # Get page content
-                content = scraper.get_page_content_advanced(business_url, worker_id=0)
-                
-                if content:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(content, 'html.parser')
-                    page_data = scraper.extract_page_data_advanced(soup, business_url)
+        async def scrape_business_pages():
+            from bs4 import BeautifulSoup
+            done = 0
+            async for business_url, content in scraper.fetch_pages(business_urls):
+                done += 1
+                try:
+                    update_progress({
+                        'progress': (done / len(business_urls)) * 90,  # Reserve 10% for final processing
+                        'pages_scraped': done,
+                        'total_pages': len(business_urls),
+                        'current_page': business_url,
+                        'message': f'Scraped business page {done} of {len(business_urls)}'
+                    })
                     
-                    # Add business page classification
-                    page_data['page_type'] = _classify_business_page(business_url, page_data)
-                    page_data['business_relevance'] = _calculate_business_relevance(page_data)
+                    if content:
+                        soup = BeautifulSoup(content, 'lxml')
+                        page_data = scraper.extract_page_data_advanced(soup, business_url)
+                        
+                        # Add business page classification
+                        page_data['page_type'] = _classify_business_page(business_url, page_data)
+                        page_data['business_relevance'] = _calculate_business_relevance(page_data)
+                        
+                        scraped_pages[business_url] = page_data
+                        logger.info(f"Successfully scraped business page: {business_url}")
+                    else:
+                        failed_urls.append(business_url)
+                        logger.warning(f"Failed to scrape business page: {business_url}")
                     
-                    scraped_data.append(page_data)
-                    logger.info(f"Successfully scraped business page: {business_url}")
-                else:
+                except Exception as e:
+                    logger.error(f"Error scraping business page {business_url}: {e}")
                     failed_urls.append(business_url)
-                    logger.warning(f"Failed to scrape business page: {business_url}")
-                
-            except Exception as e:
-                logger.error(f"Error scraping business page {business_url}: {e}")
-                failed_urls.append(business_url)
+        
+        asyncio.run(scrape_business_pages())
+        
+        # Keep the requested page order rather than completion order
+        scraped_data = [scraped_pages[business_url] for business_url in business_urls if business_url in scraped_pages]
         
         # Optimize data for RAG
         optimized_data = scraper.optimize_data_for_rag(scraped_data)
@@ -536,33 +548,28 @@ def _generate_business_insights(data: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def _extract_contact_info_from_content(content: str) -> Dict[str, str]:
     """Extract contact information from content"""
-    import re
-    
     contact_info = {}
     
-    # Email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, content)
-    if emails:
-        contact_info['email'] = emails[0]
+    # Only the first match is kept, so stop scanning once it is found
+    email = EMAIL_RE.search(content)
+    if email:
+        contact_info['email'] = email.group()
     
-    # Phone pattern
-    phone_pattern = r'[\+]?[1-9]?[0-9]{7,15}'
-    phones = re.findall(phone_pattern, content)
-    if phones:
-        contact_info['phone'] = phones[0]
+    phone = PHONE_RE.search(content)
+    if phone:
+        contact_info['phone'] = phone.group()
     
     # Address pattern (basic)
+    content_lower = content.lower()
     address_keywords = ['address', 'location', 'office', 'headquarters']
     for keyword in address_keywords:
-        if keyword in content.lower():
-            # Try to extract text around the keyword
-            start = content.lower().find(keyword)
-            if start != -1:
-                # Get surrounding text
-                address_text = content[start:start+200]
-                contact_info['address'] = address_text.strip()
-                break
+        # Try to extract text around the keyword
+        start = content_lower.find(keyword)
+        if start != -1:
+            # Get surrounding text
+            address_text = content[start:start+200]
+            contact_info['address'] = address_text.strip()
+            break
     
     return contact_info
 
@@ -0,0 +1,72 @@
+"""Tests for DataProcessor"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from src.scraper import data_processor
+from src.scraper.data_processor import DataProcessor
+
+ORIGINAL_PRICE_RE = re.compile(r'Original price was:\s*Rs\.\s*([\d,]+\.?\d*)')
+
+
+def test_first_match_in_window_returns_first_match_inside_window():
+    matches = list(re.finditer(r'\d+', 'a 12 b 345 c 6'))
+
+    assert DataProcessor._first_match_in_window(matches, 3, 14).group() == '345'
+    assert DataProcessor._first_match_in_window(matches, 0, 14).group() == '12'
+
+
+def test_first_match_in_window_skips_match_cut_off_by_window_end():
+    content = 'Original price was: Rs. 1,000.00'
+    matches = list(ORIGINAL_PRICE_RE.finditer(content))
+    end = content.index('1,000.00') + 3
+
+    # Searching the sliced window used to capture the price truncated
+    assert ORIGINAL_PRICE_RE.search(content[:end]).group(1) == '1,0'
+
+    # A match that doesn't fit in the window is now skipped instead
+    assert DataProcessor._first_match_in_window(matches, 0, end) is None
+    assert DataProcessor._first_match_in_window(matches, 0, len(content)).group(1) == '1,000.00'
+
+
+def test_first_match_in_window_skips_match_starting_before_window():
+    matches = list(re.finditer(r'\d+', 'a 12 b'))
+
+    assert DataProcessor._first_match_in_window(matches, 3, 6) is None
+    assert DataProcessor._first_match_in_window([], 0, 6) is None
+
+
+def _raw_pages(count):
+    pages = []
+    for i in range(count):
+        content = (
+            f"Smartphones Galaxy Model {i} Pro 8GB RAM 128GB Rs. {i + 1}45,000 "
+            f"Original price was: Rs. {i + 1}60,000. -9% Fast charging camera "
+            f"Laptops Notebook Air {i} Rs. {i + 2}99,999 Lightweight design"
+        )
+        pages.append({'url': f'https://shop.lk/p{i}', 'title': f'Page {i}', 'content': content, 'timestamp': i})
+    pages.append({'url': 'https://shop.lk/empty', 'title': 'Empty', 'content': ''})
+    return {'base_url': 'https://shop.lk', 'scrape_stats': {'pages': count}, 'pages': pages}
+
+
+def test_process_raw_data_pool_matches_sequential(monkeypatch):
+    raw = _raw_pages(12)
+
+    monkeypatch.setattr(data_processor, 'PARALLEL_PAGE_THRESHOLD', 10 ** 9)
+    sequential = DataProcessor().process_raw_data(raw)
+    pools = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(data_processor, 'ProcessPoolExecutor', RecordingPool)
+    monkeypatch.setattr(data_processor, 'PARALLEL_PAGE_THRESHOLD', 1)
+    pooled = DataProcessor().process_raw_data(raw)
+
+    sequential.pop('processing_timestamp')
+    pooled.pop('processing_timestamp')
+    assert len(pools) == 1
+    assert sequential['products']
+    assert pooled == sequential
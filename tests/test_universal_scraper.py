@@ -0,0 +1,98 @@
+"""Tests for UniversalScraper"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.scraper import universal_scraper
+from src.scraper.universal_scraper import UniversalScraper
+
+
+@pytest.fixture
+def scraper(monkeypatch, tmp_path):
+    monkeypatch.setenv('MAX_WORKERS', '4')
+    monkeypatch.setenv('REQUEST_DELAY', '2.0')
+    monkeypatch.setenv('USE_SELENIUM', 'false')
+    monkeypatch.setenv('USE_PLAYWRIGHT', 'false')
+    return UniversalScraper('https://example.com/', output_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('HTTPS://Example.COM:443/Shop/?b=2&a=1#reviews', 'https://example.com/Shop?a=1&b=2'),
+    ('http://example.com:80', 'http://example.com/'),
+    ('http://example.com:8080/a/', 'http://example.com:8080/a'),
+    ('https://example.com/a?q=', 'https://example.com/a?q='),
+])
+def test_canonicalize(scraper, url, expected):
+    assert scraper._canonicalize(url) == expected
+
+
+def test_dedupe_urls_keeps_first_spelling(scraper):
+    urls = ['https://example.com/a/', 'https://EXAMPLE.com/a#top', 'https://example.com/b', 'https://example.com/a']
+
+    assert scraper._dedupe_urls(urls) == ['https://example.com/a/', 'https://example.com/b']
+
+
+def test_enqueue_queues_original_url_under_canonical_key(scraper):
+    scraper._url_queue = asyncio.Queue()
+    url = 'https://example.com/a/'
+
+    assert scraper._enqueue(url, scraper._canonicalize(url))
+    assert scraper._url_queue.get_nowait() == url
+    assert 'https://example.com/a' in scraper._visited
+
+
+def test_wait_for_host_slot_spaces_requests_per_host(scraper, monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(universal_scraper.time, 'monotonic', lambda: 100.0)
+    monkeypatch.setattr(universal_scraper.asyncio, 'sleep', fake_sleep)
+
+    async def reserve():
+        for url in ['https://example.com/a', 'https://example.com/b', 'https://other.com/a', 'https://example.com/c']:
+            await scraper._wait_for_host_slot(url)
+
+    asyncio.run(reserve())
+
+    # REQUEST_DELAY 2.0 over 4 workers: one request per host every 0.5s, other hosts don't wait
+    assert scraper._host_interval == 0.5
+    assert sleeps == [pytest.approx(0.5), pytest.approx(1.0)]
+    assert scraper._host_next_ok == {'example.com': pytest.approx(101.5), 'other.com': pytest.approx(100.5)}
+
+
+def test_fetch_pages_yields_every_url_within_worker_cap(scraper):
+    scraper.delay = 0.0
+    scraper._host_interval = 0.0
+    in_flight = 0
+    peak = 0
+
+    async def page(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.match_info['name'] == 'missing':
+            raise web.HTTPNotFound()
+        return web.Response(text=f"<html>{request.match_info['name']}</html>")
+
+    async def fetch_all():
+        app = web.Application()
+        app.router.add_get('/{name}', page)
+        async with TestServer(app) as server:
+            urls = [str(server.make_url(f'/p{i}')) for i in range(10)] + [str(server.make_url('/missing'))]
+            results = {url: content async for url, content in scraper.fetch_pages(urls)}
+        return urls, results
+
+    urls, results = asyncio.run(fetch_all())
+
+    assert set(results) == set(urls)
+    assert results[urls[-1]] is None
+    assert results[urls[0]] == b'<html>p0</html>'
+    assert scraper.stats['requests_pages'] == 10
+    assert 1 < peak <= scraper.max_workers